@@ -1,7 +1,7 @@
 """
 Setup script for creating a macOS application bundle.
 """
-from setuptools import setup, find_packages
+from setuptools import setup
 
 APP = ['src/project_manager/__main__.py']
 DATA_FILES = []
@@ -15,14 +15,20 @@ OPTIONS = {
         'CFBundleVersion': '0.1.0',
         'CFBundleShortVersionString': '0.1.0',
     },
+    # rumps relies on dynamic imports and must be copied whole; everything
+    # else goes through modulegraph so unused submodules are pruned
     'packages': [
         'rumps',
-        'PIL',
+    ],
+    'includes': [
         'psutil',
         'pymysql',
+        'pymysql.err',
         'tkinter',
-    ],
-    'includes': [
+        'tkinter.ttk',
+        'tkinter.messagebox',
+        'multiprocessing.forkserver',
+        'multiprocessing.popen_forkserver',
         'pkg_resources',
         'packaging',
         'packaging.version',
@@ -32,18 +38,38 @@ OPTIONS = {
     'excludes': [
         'setuptools',
         'pip',
-        'wheel'
+        'wheel',
+        # Unused stdlib packages that would otherwise be bundled
+        'test',
+        'unittest',
+        'tkinter.test',
+        'lib2to3',
+        'distutils',
+        'xml.dom',
+        'email.test',
+        'pydoc_data',
+        'curses',
+        'sqlite3.test',
     ],
     'iconfile': 'src/project_manager/assets/icon.png',
     'resources': ['src/project_manager/assets'],
     'strip': True,
+    'optimize': 2,
+    'no_chdir': True,  # Nothing relies on the working directory
     'semi_standalone': False,
 }
 
 setup(
     name="project_manager",
     version="0.1.0",
-    packages=find_packages('src'),
+    packages=[
+        'project_manager',
+        'project_manager.models',
+        'project_manager.services',
+        'project_manager.ui',
+        'project_manager.ui.components',
+        'project_manager.utils',
+    ],
     package_dir={'': 'src'},
     app=APP,
     data_files=DATA_FILES,
@@ -51,7 +77,6 @@ setup(
     setup_requires=['py2app'],
     install_requires=[
         'rumps>=0.4.0',
-        'pillow>=10.1.0',
         'psutil>=5.9.0',
         'pymysql>=1.1.0'
     ]
@@ -1,42 +1,109 @@
+import atexit
 import logging
+import logging.handlers
 import multiprocessing
+import queue
+from multiprocessing.context import BaseContext
 from pathlib import Path
 
 from .services.project_service import ProjectService
 from .services.script_service import ScriptService
-from .ui.status_bar import ProjectManagerStatusBar
-from .ui.window_manager import start_window
+from .utils.ipc import StateChannel
 
+logger = logging.getLogger(__name__)
 
-def main() -> None:
-    """Run the application."""
-    # Configure multiprocessing to use 'spawn' on macOS
-    multiprocessing.set_start_method('spawn')
+
+def _get_mp_context() -> BaseContext:
+    """Get the multiprocessing context used to start the window process.
+
+    forkserver children are forked from a server process that has already
+    imported the window modules, so they start in milliseconds instead of
+    re-importing everything like spawn does. rumps/AppKit are deliberately not
+    preloaded: the Objective-C runtime must not be initialized before a fork.
+
+    The same method becomes the process-wide default unless one was already
+    chosen, so calling main() more than once (tests, launcher shims) never
+    trips set_start_method()'s RuntimeError or overrides the embedder.
+
+    Returns:
+        forkserver context when available, spawn context otherwise
+
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        method = 'forkserver'
+    else:
+        method = 'spawn'
     
+    if multiprocessing.get_start_method(allow_none=True) is None:
+        multiprocessing.set_start_method(method)
+
+    ctx = multiprocessing.get_context(method)
+    if method == 'forkserver':
+        ctx.set_forkserver_preload(['project_manager.ui.window_manager'])
+    return ctx
+
+
+def _configure_logging() -> None:
+    """Configure logging with record emission on a background thread.
+
+    Callers only enqueue records; a QueueListener thread does the formatting
+    and the blocking stream writes. The format never shows thread or process
+    names, so LogRecord is told not to look them up.
+    """
     # Set up logging to show only INFO and above by default
     logging.basicConfig(
         level=logging.INFO,
         format='%(levelname)s: %(message)s'
     )
     
+    # Skip the thread/process lookups in LogRecord.__init__
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Enable debug logging only for specific modules
     logging.getLogger('project_manager.ui').setLevel(logging.DEBUG)
     
-    logger = logging.getLogger(__name__)
+    # Move the stream handler behind a queue
+    root = logging.getLogger()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root.handlers, respect_handler_level=True
+    )
+    root.handlers = [logging.handlers.QueueHandler(log_queue)]
+    listener.start()
+    atexit.register(listener.stop)
+
+
+def main() -> None:
+    """Run the application."""
+    ctx = _get_mp_context()
+
+    _configure_logging()
     
     logger.info("Starting application...")
+
+    # UI modules pull in rumps/tkinter; import them only once the
+    # process is configured
+    from .ui.status_bar import ProjectManagerStatusBar
+    from .ui.window_manager import WindowProcess
+
     try:
-        # Start window process
-        window_process = multiprocessing.Process(target=start_window)
-        window_process.start()
-        logger.debug(f"Started window process with PID: {window_process.pid}")
+        # Shared memory channel the project service publishes every save on,
+        # so both processes stay on the same project list
+        state_channel = StateChannel(ctx)
         
-        # Initialize services for status bar
-        project_service = ProjectService()
+        # Initialize services once; the window process receives the already
+        # loaded state instead of scanning the projects directory again
+        project_service = ProjectService(state_channel)
         script_service = ScriptService()
         
+        # Start window process
+        window = WindowProcess(ctx, project_service, script_service)
+        window.open()
+
         # Create and run status bar app
-        app = ProjectManagerStatusBar(project_service, script_service)
+        app = ProjectManagerStatusBar(project_service, script_service, window)
         logger.debug("Created status bar app")
         
         # This will block and run the app
@@ -44,9 +111,8 @@ def main() -> None:
         app.run()
         
         # Clean up window process when app exits
-        if window_process.is_alive():
-            window_process.terminate()
-            window_process.join(timeout=5)
+        window.close()
+        state_channel.close()
         
         logger.debug("Application finished")
     except Exception as e:
@@ -2,12 +2,20 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+# Default Herd URL parts, concatenated with the project name
+_FE_URL_PREFIX = "https://app."
+_BE_URL_PREFIX = "https://api."
+_URL_SUFFIX = ".test"
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class Project:
     """
     Represents a local development project with its configuration.
 
+    Instances are immutable; use ``dataclasses.replace`` to derive an
+    updated copy.
+
     Attributes:
         name: The project's name (used in directory structure)
         pretty_name: A human-readable name for the project
@@ -28,9 +36,43 @@ class Project:
     be_url: Optional[str] = None
     fe_process_pid: Optional[int] = None
 
+    @classmethod
+    def with_default_urls(
+        cls,
+        name: str,
+        pretty_name: str,
+        port: int,
+        redis_db: Optional[int],
+        directory: Path
+    ) -> "Project":
+        """Create a project using the default Herd URLs.
+
+        Args:
+            name: The project's name
+            pretty_name: A human-readable name for the project
+            port: The port number assigned to this project
+            redis_db: The Redis database number assigned to this project
+            directory: Path to the project's root directory
+
+        Returns:
+            The new Project
+
+        """
+        return cls(
+            name,
+            pretty_name,
+            port,
+            redis_db,
+            directory,
+            _FE_URL_PREFIX + name + _URL_SUFFIX,
+            _BE_URL_PREFIX + name + _URL_SUFFIX
+        )
+
     def __post_init__(self) -> None:
         """Set default URLs if not provided."""
+        if self.fe_url and self.be_url:
+            return
         if not self.fe_url:
-            self.fe_url = f"https://app.{self.name}.test"
+            object.__setattr__(self, "fe_url", _FE_URL_PREFIX + self.name + _URL_SUFFIX)
         if not self.be_url:
-            self.be_url = f"https://api.{self.name}.test" 
\ No newline at end of file
+            object.__setattr__(self, "be_url", _BE_URL_PREFIX + self.name + _URL_SUFFIX)
@@ -1,21 +1,204 @@
 import json
 import logging
+import os
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 
 from ..models.project import Project
-from ..utils.config import PROJECT_DATA_FILE, PROJECTS_DIR, MIN_PORT, MAX_PORT, MIN_REDIS_DB, MAX_REDIS_DB
+from ..utils.ipc import RELOAD, StateChannel
+from ..utils.serialization import dumps, loads
+from ..utils import config
+from ..utils.config import MIN_PORT, MAX_PORT, MIN_REDIS_DB, MAX_REDIS_DB
 
 logger = logging.getLogger(__name__)
 
+# Names of the frontend and backend subdirectories of a project
+Layout = Tuple[str, str]
+
+# Port notations in a package.json script, in order of precedence: the -p
+# of "next dev" ("-p 3000"/"-p3000"), any other -p, "--port 3000"/"--port=3000"
+# and finally a "PORT=3000" environment assignment
+_PORT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'next\s+dev.*?-p\s*(\d+)',
+        r'-p\s*(\d+)',
+        r'--port[=\s]*(\d+)',
+        r'\bPORT=(\d+)',
+    )
+)
+
+
+
+@lru_cache(maxsize=256)
+def _parse_json_file(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a JSON file, memoized on its path and stat signature.
+
+    A changed file gets a new mtime/size and therefore a new cache entry, so
+    stale contents are never returned. Callers must not mutate the result.
+
+    Args:
+        path: File path
+        mtime_ns: Modification time of the file in nanoseconds
+        size: File size in bytes
+
+    Returns:
+        The parsed JSON document
+
+    """
+    with open(path, 'rb') as f:
+        return loads(f.read())
+
+
+@lru_cache(maxsize=512)
+def _pretty_name(name: str) -> str:
+    """Derive a display name from a project directory name.
+
+    Args:
+        name: Project name, e.g. "my-app"
+
+    Returns:
+        The display name, e.g. "My App"
+
+    """
+    return name.replace('-', ' ').title()
+
+
+def _read_json(path: Union[str, Path]) -> Any:
+    """Read a JSON file, reusing the parsed result while the file is unchanged.
+
+    Args:
+        path: File path
+
+    Returns:
+        The parsed JSON document
+
+    """
+    st = os.stat(path)
+    return _parse_json_file(os.fspath(path), st.st_mtime_ns, st.st_size)
+
 
 class ProjectService:
-    """Service for managing local development projects."""
+    """Service for managing local development projects.
 
-    def __init__(self) -> None:
-        """Initialize the ProjectService."""
+    When a state channel is attached, every save is published on it so the
+    status bar and window processes work off one shared copy of the project
+    list; call sync_shared_state to pick up the other process's changes.
+    """
+
+    def __init__(self, state_channel: Optional[StateChannel] = None) -> None:
+        """Initialize the ProjectService.
+
+        Args:
+            state_channel: Channel shared with the other UI process
+
+        """
         self.projects: List[Project] = []
-        self._load_projects()
+        # Lookup indices over self.projects, kept in sync on every mutation
+        self._by_name: Dict[str, Project] = {}
+        self._by_port: Set[int] = set()
+        self._by_redis_db: Set[int] = set()
+        self.state_channel = state_channel
+        # Held while the projects are read from disk, changed or saved, so a
+        # rescan running in a worker thread does not interleave with the UI
+        self._lock = threading.RLock()
+        self._data_dir_ensured = False
+        # Bytes of the projects file as last read or written by this process
+        self._last_saved: Optional[bytes] = None
+        self._probe_cache: Optional[Dict[Tuple[Callable[[str], bool], str], bool]] = None
+        self._layout_cache: Optional[Dict[Tuple[str, str], Optional[Layout]]] = None
+        with self._stat_cache():
+            self._load_projects()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state; the lock stays behind."""
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state in another process with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @contextmanager
+    def _stat_cache(self) -> Iterator[None]:
+        """Cache filesystem probes for the duration of one load or scan pass.
+
+        The projects directory does not change while it is being scanned, so
+        every candidate path only needs to be stat'ed once per pass.
+        """
+        self._probe_cache = {}
+        self._layout_cache = {}
+        try:
+            yield
+        finally:
+            self._probe_cache = None
+            self._layout_cache = None
+
+    def _probe(self, check: Callable[[str], bool], path: Union[str, Path]) -> bool:
+        """Run a filesystem check, reusing the result within a scan pass.
+
+        Args:
+            check: os.path.isdir or os.path.isfile
+            path: Path to check
+
+        Returns:
+            The result of the check
+
+        """
+        path = os.fspath(path)
+        if self._probe_cache is None:
+            return check(path)
+        key = (check, path)
+        if (result := self._probe_cache.get(key)) is None:
+            result = self._probe_cache[key] = check(path)
+        return result
+
+    def _isdir(self, path: Union[str, Path]) -> bool:
+        """Check whether path is a directory."""
+        return self._probe(os.path.isdir, path)
+
+    def _isfile(self, path: Union[str, Path]) -> bool:
+        """Check whether path is a regular file."""
+        return self._probe(os.path.isfile, path)
+
+    def _reindex(self) -> None:
+        """Rebuild the lookup indices after self.projects was replaced."""
+        self._by_name = {p.name: p for p in self.projects}
+        self._by_port = {p.port for p in self.projects}
+        self._by_redis_db = {p.redis_db for p in self.projects if p.redis_db is not None}
+
+    def _add_to_index(self, project: Project) -> None:
+        """Add a project that was appended to self.projects to the indices."""
+        self._by_name[project.name] = project
+        self._by_port.add(project.port)
+        if project.redis_db is not None:
+            self._by_redis_db.add(project.redis_db)
+
+    def _iter_project_dirs(self) -> Iterator[Path]:
+        """Iterate over the directories directly inside the projects directory.
+
+        os.scandir answers is_dir() from the directory listing itself on most
+        filesystems, so this costs no stat() per entry the way iterdir() plus
+        Path.is_dir() does. Symlinked project directories are still followed.
+
+        Yields:
+            Path of each candidate project directory
+
+        """
+        with os.scandir(config.projects_dir()) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                if self._probe_cache is not None:
+                    self._probe_cache[(os.path.isdir, entry.path)] = True
+                yield Path(entry.path)
 
     def _extract_port_from_script(self, script: str) -> Optional[int]:
         """
@@ -27,25 +210,10 @@ class ProjectService:
         Returns:
             Port number if found, None otherwise
         """
-        # Common patterns for port specification
-        patterns = [
-            r'next\s+dev\s+-p\s*(\d+)',  # next dev -p 3000
-            r'next\s+dev.*?-p\s*(\d+)',  # next dev with stuff before -p
-            r'-p\s*(\d+)',               # -p 3000 or -p3000
-            r'--port\s*(\d+)',           # --port 3000 or --port=3000
-            r'PORT=(\d+)',               # PORT=3000
-        ]
-        
-        logger.debug(f"Checking script for port: {script}")
-        for pattern in patterns:
-            import re
-            if match := re.search(pattern, script, re.IGNORECASE):  # Make search case-insensitive
-                try:
-                    port = int(match.group(1))
-                    logger.debug(f"Found port {port} using pattern {pattern}")
-                    return port
-                except ValueError:
-                    continue
+        logger.debug("Checking script for port: %s", script)
+        for pattern in _PORT_PATTERNS:
+            if match := pattern.search(script):
+                return int(match.group(1))
         return None
 
     def _read_package_json(self, project_dir: Path) -> Dict:
@@ -72,21 +240,26 @@ class ProjectService:
             project_dir / f"{project_dir.name}-api" / "package.json"
         ]
         
-        # Try frontend first, then backend
-        for pkg_file in [*fe_locations, *be_locations]:
-            logger.debug(f"Checking for package.json at: {pkg_file}")
-            if pkg_file.exists():
+        # Try the detected layout's frontend first, then frontend, then backend
+        candidates = [*fe_locations, *be_locations]
+        if layout := self._detect_structure(project_dir, project_dir.name):
+            first = project_dir / layout[0] / "package.json"
+            candidates.remove(first)
+            candidates.insert(0, first)
+
+        for pkg_file in candidates:
+            logger.debug("Checking for package.json at: %s", pkg_file)
+            if self._isfile(pkg_file):
                 try:
-                    with open(pkg_file) as f:
-                        data = json.load(f)
-                        logger.debug(f"Found package.json at {pkg_file}")
-                        if 'scripts' in data:
-                            logger.debug(f"Scripts found: {data['scripts']}")
-                        return data
+                    data = _read_json(pkg_file)
+                    logger.debug("Found package.json at %s", pkg_file)
+                    if 'scripts' in data:
+                        logger.debug("Scripts found: %s", data['scripts'])
+                    return data
                 except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in {pkg_file}")
+                    logger.warning("Invalid JSON in %s", pkg_file)
                 except Exception as e:
-                    logger.warning(f"Error reading {pkg_file}: {e}")
+                    logger.warning("Error reading %s: %s", pkg_file, e)
         
         logger.debug("No package.json found")
         return {}
@@ -107,29 +280,29 @@ class ProjectService:
             
         # Check scripts section
         scripts = pkg_data.get('scripts', {})
-        logger.debug(f"Checking scripts: {scripts}")
+        logger.debug("Checking scripts: %s", scripts)
         
         # First check dev script as it's most likely to have the correct port
         if dev_script := scripts.get('dev'):
-            logger.debug(f"Checking dev script: {dev_script}")
+            logger.debug("Checking dev script: %s", dev_script)
             if port := self._extract_port_from_script(dev_script):
-                logger.debug(f"Found port {port} in dev script")
+                logger.debug("Found port %s in dev script", port)
                 return port
         
         # Then check other common scripts
         for script_name in ['start', 'serve']:
             if script := scripts.get(script_name):
-                logger.debug(f"Checking {script_name} script: {script}")
+                logger.debug("Checking %s script: %s", script_name, script)
                 if port := self._extract_port_from_script(script):
-                    logger.debug(f"Found port {port} in {script_name} script")
+                    logger.debug("Found port %s in %s script", port, script_name)
                     return port
                 else:
-                    logger.debug(f"No port found in {script_name} script")
+                    logger.debug("No port found in %s script", script_name)
         
         # Check next.js config
         if 'next' in pkg_data.get('dependencies', {}):
             next_config = pkg_data.get('config', {})
-            logger.debug(f"Checking Next.js config: {next_config}")
+            logger.debug("Checking Next.js config: %s", next_config)
             if port := next_config.get('port'):
                 try:
                     return int(port)
@@ -145,42 +318,49 @@ class ProjectService:
             port_num = int(port)
             # Any port between 1 and 65535 is technically valid
             is_valid = 1 <= port_num <= 65535
-            logger.debug(f"Port {port} validity check: {is_valid}")
+            logger.debug("Port %s validity check: %s", port, is_valid)
             return is_valid
         except (TypeError, ValueError):
-            logger.debug(f"Invalid port value: {port}")
+            logger.debug("Invalid port value: %s", port)
             return False
 
-    def _get_next_port(self) -> int:
-        """Get next available port number."""
-        used_ports = {p.port for p in self.projects}
-        logger.debug(f"Finding next port. Currently used: {used_ports}")
+    def _get_next_port(self, used_ports: Optional[Set[int]] = None) -> int:
+        """Get next available port number.
+
+        Args:
+            used_ports: Ports to avoid; defaults to those of the current
+                projects. Scans pass their own set so projects found earlier
+                in the same pass are taken into account.
+
+        """
+        if used_ports is None:
+            used_ports = self._by_port
+        logger.debug("Finding next port. Currently used: %s", used_ports)
         
         if not used_ports:
             default_port = 3000
-            logger.debug(f"No ports in use, using default: {default_port}")
+            logger.debug("No ports in use, using default: %s", default_port)
             return default_port
         
         # Start with common development ports
         common_ports = [3000, 3001, 3002, 3003, 3004, 3005]
         for port in common_ports:
             if port not in used_ports:
-                logger.debug(f"Found available common port: {port}")
+                logger.debug("Found available common port: %s", port)
                 return port
         
         # If no common ports available, use the next port after the highest
         next_port = max(used_ports) + 1
-        logger.debug(f"Using next sequential port: {next_port}")
+        logger.debug("Using next sequential port: %s", next_port)
         return next_port
 
     def _is_laravel_project(self, be_dir: Path) -> bool:
         """Check if this is a Laravel project."""
         composer_json = be_dir / "composer.json"
-        if composer_json.exists():
+        if self._isfile(composer_json):
             try:
-                with open(composer_json) as f:
-                    data = json.load(f)
-                    return "laravel/framework" in data.get("require", {})
+                data = _read_json(composer_json)
+                return "laravel/framework" in data.get("require", {})
             except Exception:
                 pass
         return False
@@ -195,241 +375,274 @@ class ProjectService:
         Returns:
             Redis DB number if found, None if not found or invalid
         """
-        # Check possible backend locations
+        # Check possible backend locations, the detected layout's first
         be_locations = [
             project_dir / "api",
             project_dir / f"{project_dir.name}-api"
         ]
+        if layout := self._detect_structure(project_dir, project_dir.name):
+            first = project_dir / layout[1]
+            be_locations.remove(first)
+            be_locations.insert(0, first)
         
-        logger.debug(f"Checking Redis DB in backend locations for {project_dir.name}")
+        logger.debug("Checking Redis DB in backend locations for %s", project_dir.name)
         
         for be_dir in be_locations:
             env_file = be_dir / ".env"
-            logger.debug(f"Checking for .env at: {env_file}")
+            logger.debug("Checking for .env at: %s", env_file)
             
-            if env_file.exists():
-                logger.debug(f"Found .env file at {env_file}")
+            if self._isfile(env_file):
+                logger.debug("Found .env file at %s", env_file)
                 try:
+                    # Stream the file and stop at the first usable value
                     with open(env_file) as f:
-                        env_content = f.read()
-                        logger.debug(f"ENV file contents for {project_dir.name}:\n{env_content}")
-                        
-                        for line in env_content.splitlines():
+                        for line in f:
                             line = line.strip()
                             if line.startswith(('REDIS_DB=', 'REDIS_CACHE_DB=')):
+                                value = line.split('=', 1)[1].strip()
+                                if not value:  # Only parse if value is not empty
+                                    continue
                                 try:
-                                    value = line.split('=')[1].strip()
-                                    if value:  # Only parse if value is not empty
-                                        redis_db = int(value)
-                                        logger.debug(f"Found Redis DB value: {redis_db}")
-                                        return redis_db
-                                except (IndexError, ValueError) as e:
-                                    logger.debug(f"Failed to parse Redis DB value: {e}")
+                                    redis_db = int(value)
+                                except ValueError as e:
+                                    logger.debug("Failed to parse Redis DB value: %s", e)
                                     continue
+                                logger.debug("Found Redis DB value: %s", redis_db)
+                                return redis_db
                 except Exception as e:
-                    logger.warning(f"Error reading .env file: {e}")
+                    logger.warning("Error reading .env file: %s", e)
             else:
-                logger.debug(f"No .env file found at {env_file}")
+                logger.debug("No .env file found at %s", env_file)
         
-        logger.debug(f"No Redis DB found for {project_dir.name}")
+        logger.debug("No Redis DB found for %s", project_dir.name)
         return None
 
     def _scan_projects_directory(self) -> None:
         """Scan the projects directory for untracked projects."""
-        logger.debug(f"Scanning directory: {PROJECTS_DIR}")
+        logger.debug("Scanning directory: %s", config.projects_dir())
         
         # Track used ports to avoid duplicates
-        used_ports = {p.port for p in self.projects}
-        logger.debug(f"Currently used ports: {used_ports}")
+        used_ports = set(self._by_port)
+        logger.debug("Currently used ports: %s", used_ports)
         
         # Initialize project data dictionary
         project_data = {}
         
-        for path in PROJECTS_DIR.iterdir():
-            if not path.is_dir():
-                continue
-            
-            if not any(p.name == path.name for p in self.projects):
+        for path in self._iter_project_dirs():
+            if path.name not in self._by_name:
                 name = path.name
-                logger.debug(f"\nProcessing project directory: {name}")
+                logger.debug("\nProcessing project directory: %s", name)
                 
-                # Try to detect project structure
-                app_dir = path / f"{name}-app"
-                api_dir = path / f"{name}-api"
-                www_dir = path / "www"
-                standard_api_dir = path / "api"
-                plain_app_dir = path / "app"
-                
-                # Check all three possible structures
-                has_named_app_api = app_dir.exists() and api_dir.exists()
-                has_plain_app_api = plain_app_dir.exists() and standard_api_dir.exists()
-                has_www_api = www_dir.exists() and standard_api_dir.exists()
-                
-                if has_named_app_api or has_plain_app_api or has_www_api:
-                    # Read package.json for port number
-                    pkg_data = self._read_package_json(path)
-                    detected_port = self._get_port_from_package(pkg_data)
-                    
-                    # Get Redis DB from .env
-                    redis_db = self._get_redis_db_from_env(path)
-                    logger.debug(f"Detected Redis DB for {name}: {redis_db}")
-                    
-                    # If no port detected, assign a new one
-                    if not detected_port or not self._is_valid_port(detected_port):
-                        detected_port = self._get_next_port()
-                        logger.debug(f"Assigned new port {detected_port} for {name}")
-                    
-                    logger.debug(f"Found new project {name} with port {detected_port}")
-                    project_data[name] = {
-                        "name": name,
-                        "pretty_name": name.replace('-', ' ').title(),
-                        "port": detected_port,
-                        "redis_db": redis_db,
-                        "directory": path,
-                        "fe_url": f"https://app.{name}.test",
-                        "be_url": f"https://api.{name}.test"
-                    }
+                if self._detect_structure(path, name):
+                    project_data[name] = self._new_project(path, used_ports)
         
         # Add new projects to self.projects
-        for data in project_data.values():
-            project = Project(**data)
+        for project in project_data.values():
             self.projects.append(project)
-            logger.debug(f"Added new project: {project.name}")
+            self._add_to_index(project)
+            logger.debug("Added new project: %s", project.name)
         
         # Save if we found any new projects
         if project_data:
             self.save_projects()
-            logger.debug(f"Saved {len(project_data)} new projects")
+            logger.debug("Saved %s new projects", len(project_data))
 
-    def _load_projects(self) -> None:
-        """Load projects from the data file and scan the projects directory."""
-        logger.debug("Loading projects...")
-        
-        # Track all project directories and their data
-        project_data = {}
+    def _read_saved_records(self) -> Dict[str, Dict]:
+        """Read the saved project records from the data file.
+
+        Returns:
+            Records keyed by project name, in file order
+
+        """
+        data_file = config.project_data_file()
+        if not self._isfile(data_file):
+            return {}
+        logger.debug("Loading saved data from %s", data_file)
+        try:
+            with open(data_file, "rb") as f:
+                self._last_saved = f.read()
+            return {data["name"]: data for data in loads(self._last_saved)}
+        except Exception as e:
+            logger.error("Error loading projects file: %s", e)
+            return {}
+
+    def _refresh_saved_record(self, data: Dict, directory: Path) -> Project:
+        """Build a project from a saved record, refreshing what may have changed.
+
+        Args:
+            data: Saved project record
+            directory: Verified project directory
+
+        Returns:
+            The loaded project
+
+        """
+        name = data["name"]
+        data['directory'] = directory
+
+        # Check if frontend process is still running
+        if data.get('fe_process_pid'):
+            import psutil
+            if not psutil.pid_exists(data['fe_process_pid']):
+                data['fe_process_pid'] = None
+
+        # Check for Redis DB in .env even for saved projects
+        redis_db = self._get_redis_db_from_env(directory)
+        if redis_db is not None:
+            data['redis_db'] = redis_db
+            logger.debug("Updated Redis DB for %s to %s", name, redis_db)
+
+        # Re-check port from package.json
+        pkg_data = self._read_package_json(directory)
+        if detected_port := self._get_port_from_package(pkg_data):
+            if detected_port != data.get('port'):
+                logger.debug(
+                    "Updating port for %s from %s to %s", name, data.get('port'), detected_port
+                )
+                data['port'] = detected_port
+
+        logger.debug(
+            "Loaded saved project: %s (port=%s, redis_db=%s)", name, data['port'], data['redis_db']
+        )
+        return Project(**data)
+
+    def _new_project(self, path: Path, used_ports: Set[int]) -> Project:
+        """Build a project for a directory that has no saved record.
+
+        Args:
+            path: Project directory with a valid layout
+            used_ports: Ports already taken in this pass; the project's port
+                is added to it
+
+        Returns:
+            The new project
+
+        """
+        name = path.name
         
-        # First load saved data
-        if PROJECT_DATA_FILE.exists():
-            logger.debug(f"Loading saved data from {PROJECT_DATA_FILE}")
-            try:
-                with open(PROJECT_DATA_FILE, "r") as f:
-                    saved_data = json.load(f)
-                    for data in saved_data:
-                        name = data["name"]
-                        # Convert directory string to Path
-                        directory = Path(data['directory'])
-                        
-                        # Skip if directory doesn't exist
-                        if not directory.exists():
-                            logger.debug(f"Skipping {name} - directory not found: {directory}")
-                            continue
-                            
-                        # Skip if neither frontend nor backend exists
-                        app_dir = directory / f"{name}-app"
-                        api_dir = directory / f"{name}-api"
-                        www_dir = directory / "www"
-                        standard_api_dir = directory / "api"
-                        plain_app_dir = directory / "app"
-                        
-                        # Check all three possible structures
-                        has_named_app_api = app_dir.exists() and api_dir.exists()
-                        has_plain_app_api = plain_app_dir.exists() and standard_api_dir.exists()
-                        has_www_api = www_dir.exists() and standard_api_dir.exists()
-                        
-                        if not (has_named_app_api or has_plain_app_api or has_www_api):
-                            logger.debug(f"Skipping {name} - no valid project structure found")
-                            continue
-                        
-                        data['directory'] = directory
-                        
-                        # Check if frontend process is still running
-                        if data.get('fe_process_pid'):
-                            import psutil
-                            if not psutil.pid_exists(data['fe_process_pid']):
-                                data['fe_process_pid'] = None
-                        
-                        # Check for Redis DB in .env even for saved projects
-                        redis_db = self._get_redis_db_from_env(directory)
-                        if redis_db is not None:
-                            data['redis_db'] = redis_db
-                            logger.debug(f"Updated Redis DB for {name} to {redis_db}")
-                        
-                        # Re-check port from package.json
-                        pkg_data = self._read_package_json(directory)
-                        if detected_port := self._get_port_from_package(pkg_data):
-                            if detected_port != data.get('port'):
-                                logger.debug(f"Updating port for {name} from {data.get('port')} to {detected_port}")
-                                data['port'] = detected_port
-                        
-                        project_data[name] = data
-                        logger.debug(f"Loaded saved project: {name} (port={data['port']}, redis_db={data['redis_db']})")
-            except Exception as e:
-                logger.error(f"Error loading projects file: {e}")
+        # Read package.json for port number
+        pkg_data = self._read_package_json(path)
+        detected_port = self._get_port_from_package(pkg_data)
+
+        # Get Redis DB from .env
+        redis_db = self._get_redis_db_from_env(path)
+        logger.debug("Detected Redis DB for %s: %s", name, redis_db)
+
+        # If no port detected, assign a new one
+        if not detected_port or not self._is_valid_port(detected_port):
+            detected_port = self._get_next_port(used_ports)
+            logger.debug("Assigned new port %s for %s", detected_port, name)
+        used_ports.add(detected_port)
+
+        logger.debug("Found new project %s with port %s", name, detected_port)
+        return Project.with_default_urls(
+            name=name,
+            pretty_name=_pretty_name(name),
+            port=detected_port,
+            redis_db=redis_db,
+            directory=path
+        )
+
+    def _load_projects(self) -> None:
+        """Load projects from the data file and scan the projects directory.
+
+        The projects directory is walked once and joined against the saved
+        records by name. Saved projects that live elsewhere are checked
+        individually afterwards.
+        """
+        with self._lock:
+            logger.debug("Loading projects...")
         
-        # Then scan directory for new projects only
-        for path in PROJECTS_DIR.iterdir():
-            if not path.is_dir():
-                continue
-                
-            name = path.name
-            if name not in project_data:  # Only process new projects
-                # Try to detect project structure
-                app_dir = path / f"{name}-app"
-                api_dir = path / f"{name}-api"
-                www_dir = path / "www"
-                standard_api_dir = path / "api"
-                plain_app_dir = path / "app"
-                
-                # Check all three possible structures
-                has_named_app_api = app_dir.exists() and api_dir.exists()
-                has_plain_app_api = plain_app_dir.exists() and standard_api_dir.exists()
-                has_www_api = www_dir.exists() and standard_api_dir.exists()
-                
-                if has_named_app_api or has_plain_app_api or has_www_api:
-                    # Read package.json for port number
-                    pkg_data = self._read_package_json(path)
-                    detected_port = self._get_port_from_package(pkg_data)
-                    
-                    # Get Redis DB from .env
-                    redis_db = self._get_redis_db_from_env(path)
-                    logger.debug(f"Detected Redis DB for {name}: {redis_db}")
-                    
-                    # If no port detected, assign a new one
-                    if not detected_port or not self._is_valid_port(detected_port):
-                        detected_port = self._get_next_port()
-                        logger.debug(f"Assigned new port {detected_port} for {name}")
-                    
-                    logger.debug(f"Found new project {name} with port {detected_port}")
-                    project_data[name] = {
-                        "name": name,
-                        "pretty_name": name.replace('-', ' ').title(),
-                        "port": detected_port,
-                        "redis_db": redis_db,
-                        "directory": path,
-                        "fe_url": f"https://app.{name}.test",
-                        "be_url": f"https://api.{name}.test",
-                        "fe_process_pid": None
-                    }
+            saved = self._read_saved_records()
+            loaded: Dict[str, Project] = {}
+            found: Dict[str, Project] = {}
+            used_ports = {data['port'] for data in saved.values()}
         
-        # Create Project objects
-        self.projects = []
-        for data in project_data.values():
-            self.projects.append(Project(**data))
-            logger.debug(f"Added project {data['name']} with port={data['port']}, redis_db={data['redis_db']}")
+            for path in self._iter_project_dirs():
+                name = path.name
+                if not self._detect_structure(path, name):
+                    continue
+                data = saved.get(name)
+                if data is not None and Path(data['directory']) == path:
+                    loaded[name] = self._refresh_saved_record(data, path)
+                else:
+                    found[name] = self._new_project(path, used_ports)
         
-        # Save to update the projects file with only existing projects
-        self.save_projects()
+            # Saved projects outside the projects directory (or moved away from it)
+            for name, data in saved.items():
+                if name in loaded:
+                    continue
+                directory = Path(data['directory'])
+                if not self._isdir(directory):
+                    logger.debug("Skipping %s - directory not found: %s", name, directory)
+                    continue
+                if not self._detect_structure(directory, name):
+                    logger.debug("Skipping %s - no valid project structure found", name)
+                    continue
+                loaded[name] = self._refresh_saved_record(data, directory)
+
+            # Saved projects first, in their saved order, then new ones
+            self.projects = [loaded[name] for name in saved if name in loaded]
+            self.projects.extend(p for name, p in found.items() if name not in loaded)
+            self._reindex()
+            if logger.isEnabledFor(logging.DEBUG):
+                for project in self.projects:
+                    logger.debug(
+                        "Added project %s with port=%s, redis_db=%s",
+                        project.name, project.port, project.redis_db
+                    )
+
+            # Save to update the projects file with only existing projects
+            self.save_projects()
         
-        logger.debug(f"Total projects loaded: {len(self.projects)}")
+            logger.debug("Total projects loaded: %s", len(self.projects))
 
     def save_projects(self) -> None:
         """Save project data to the data file."""
-        logger.debug(f"Saving {len(self.projects)} projects to {PROJECT_DATA_FILE}")
-        
-        # Create parent directory if it doesn't exist
-        PROJECT_DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
-        
-        data = [
+        with self._lock:
+            data_file = config.project_data_file()
+            logger.debug("Saving %s projects to %s", len(self.projects), data_file)
+
+            data = self.to_records()
+            payload = dumps(data, indent=True)
+            if payload == self._last_saved:
+                logger.debug("Projects unchanged, skipping save")
+                return
+
+            # Create parent directory if it doesn't exist, once per service
+            if not self._data_dir_ensured:
+                data_file.parent.mkdir(parents=True, exist_ok=True)
+                self._data_dir_ensured = True
+
+            try:
+                # Write to a temporary file first and make sure it hit the disk
+                temp_file = data_file.with_suffix('.tmp')
+                with open(temp_file, 'wb') as f:
+                    f.write(payload)
+                    f.flush()
+                    os.fsync(f.fileno())
+
+                # Rename temp file to actual file (atomic operation)
+                os.replace(temp_file, data_file)
+                self._last_saved = payload
+
+                logger.debug("Successfully saved %s projects", len(data))
+
+                if self.state_channel is not None:
+                    self.state_channel.publish(data)
+
+            except Exception as e:
+                logger.error("Error saving projects file: %s", e, exc_info=True)
+                raise
+
+    def to_records(self) -> List[Dict]:
+        """Get the projects as JSON serializable records.
+
+        Returns:
+            One dict per project, in the format of the projects data file
+
+        """
+        return [
             {
                 "name": p.name,
                 "pretty_name": p.pretty_name,
@@ -442,30 +655,50 @@ class ProjectService:
             }
             for p in self.projects
         ]
-        
+
+    def load_records(self, records: List[Dict]) -> None:
+        """Replace the in-memory projects with records from another process.
+
+        Nothing is written to disk; the publishing process owns the save.
+
+        Args:
+            records: Project records as returned by to_records
+
+        """
+        with self._lock:
+            self.projects = [
+                Project(**{**data, "directory": Path(data["directory"])})
+                for data in records
+            ]
+            self._reindex()
+            # The other process rewrote the file, so our copy of it is stale
+            self._last_saved = None
+            logger.debug("Loaded %s projects from shared state", len(self.projects))
+
+    def sync_shared_state(self) -> bool:
+        """Apply the newest project state saved by the other process.
+
+        Returns:
+            True if the projects were replaced, False if nothing changed
+
+        """
+        if self.state_channel is None:
+            return False
+        # Called from UI timers; never wait for a rescan, the snapshot stays
+        # pending until the next call
+        if not self._lock.acquire(blocking=False):
+            return False
         try:
-            # Log the data being saved
-            logger.debug(f"Project data to save: {json.dumps(data, indent=2)}")
-            
-            # Write to a temporary file first
-            temp_file = PROJECT_DATA_FILE.with_suffix('.tmp')
-            with open(temp_file, 'w') as f:
-                json.dump(data, f, indent=2)
-            
-            # Rename temp file to actual file (atomic operation)
-            temp_file.replace(PROJECT_DATA_FILE)
-            
-            logger.debug("Successfully saved projects file")
-            
-            # Verify the save
-            if PROJECT_DATA_FILE.exists():
-                with open(PROJECT_DATA_FILE) as f:
-                    saved_data = json.load(f)
-                    logger.debug(f"Verified saved data contains {len(saved_data)} projects")
-            
-        except Exception as e:
-            logger.error(f"Error saving projects file: {e}", exc_info=True)
-            raise
+            if (records := self.state_channel.poll()) is None:
+                return False
+            if records is RELOAD:
+                # The snapshot did not fit the channel; the other process
+                # saved it to the projects file before publishing
+                records = list(self._read_saved_records().values())
+            self.load_records(records)
+            return True
+        finally:
+            self._lock.release()
 
     def get_project(self, name: str) -> Optional[Project]:
         """
@@ -477,7 +710,7 @@ class ProjectService:
         Returns:
             The Project if found, None otherwise
         """
-        return next((p for p in self.projects if p.name == name), None)
+        return self._by_name.get(name)
 
     def add_project(self, project: Project) -> None:
         """
@@ -486,8 +719,10 @@ class ProjectService:
         Args:
             project: The Project to add
         """
-        self.projects.append(project)
-        self.save_projects() 
+        with self._lock:
+            self.projects.append(project)
+            self._add_to_index(project)
+            self.save_projects()
 
     def update_project(self, name: str, updates: dict) -> Optional[Project]:
         """
@@ -500,149 +735,191 @@ class ProjectService:
         Returns:
             Updated Project if found, None otherwise
         """
-        project = self.get_project(name)
-        if not project:
-            logger.warning(f"Project not found: {name}")
-            return None
+        with self._lock:
+            project = self.get_project(name)
+            if not project:
+                logger.warning("Project not found: %s", name)
+                return None
             
-        logger.debug(f"Updating project {name} with: {updates}")
-        
-        # Validate port if being updated
-        if 'port' in updates:
-            new_port = updates['port']
-            # Check if port is already in use by another project
-            if any(p.port == new_port and p.name != name for p in self.projects):
-                logger.warning(f"Port {new_port} is already in use")
-                raise ValueError(f"Port {new_port} is already in use")
-        
-        # Update project attributes
-        for key, value in updates.items():
-            if hasattr(project, key):
-                old_value = getattr(project, key)
-                setattr(project, key, value)
-                logger.debug(f"Updated {key}: {old_value} -> {value}")
-        
-        # Save changes immediately
-        try:
-            self.save_projects()
-            logger.debug(f"Successfully updated and saved project {name}")
-        except Exception as e:
-            logger.error(f"Failed to save project updates: {e}")
-            raise
+            logger.debug("Updating project %s with: %s", name, updates)
+
+            # Validate port if being updated
+            if 'port' in updates:
+                new_port = updates['port']
+                # Check if port is already in use by another project
+                if new_port in self._by_port and new_port != project.port:
+                    logger.warning("Port %s is already in use", new_port)
+                    raise ValueError(f"Port {new_port} is already in use")
+
+            # Projects are immutable, so build an updated copy and swap it in
+            changes = {}
+            for key, value in updates.items():
+                if hasattr(project, key):
+                    logger.debug("Updated %s: %s -> %s", key, getattr(project, key), value)
+                    changes[key] = value
+            index = self.projects.index(project)
+            project = replace(project, **changes)
+            self.projects[index] = project
+            self._by_name[name] = project
+            if changes.keys() & {'port', 'redis_db'}:
+                # Another project may share the old value, so recount
+                self._reindex()
+
+            # Save changes immediately
+            try:
+                self.save_projects()
+                logger.debug("Successfully updated and saved project %s", name)
+            except Exception as e:
+                logger.error("Failed to save project updates: %s", e)
+                raise
         
-        return project
+            return project
 
-    def _get_next_redis_db(self) -> int:
+    def _get_next_redis_db(self, used_dbs: Optional[Set[int]] = None) -> int:
         """Get next available Redis DB number.
         
+        Args:
+            used_dbs: Redis DBs to avoid; defaults to those of the current
+                projects
+
         Returns:
             int: Next available Redis DB number
         
         Raises:
             ValueError: If no Redis DBs are available
         """
-        used_dbs = {p.redis_db for p in self.projects if p.redis_db is not None}
-        logger.debug(f"Finding next Redis DB. Currently used: {used_dbs}")
-        
-        if not used_dbs:
-            default_db = MIN_REDIS_DB
-            logger.debug(f"No Redis DBs in use, using default: {default_db}")
-            return default_db
-            
-        # Try to find the first available DB in sequence
-        current_db = MIN_REDIS_DB
-        while current_db <= MAX_REDIS_DB:
-            if current_db not in used_dbs:
-                logger.debug(f"Found available Redis DB: {current_db}")
-                return current_db
-            current_db += 1
-            
-        raise ValueError(f"No Redis DBs available in range {MIN_REDIS_DB}-{MAX_REDIS_DB}")
+        if used_dbs is None:
+            used_dbs = self._by_redis_db
+        logger.debug("Finding next Redis DB. Currently used: %s", used_dbs)
+
+        # First free DB in sequence
+        db = next((db for db in range(MIN_REDIS_DB, MAX_REDIS_DB + 1) if db not in used_dbs), None)
+        if db is None:
+            raise ValueError(f"No Redis DBs available in range {MIN_REDIS_DB}-{MAX_REDIS_DB}")
+        logger.debug("Found available Redis DB: %s", db)
+        return db
 
     def rescan_projects(self) -> None:
-        """Force a complete rescan of projects from filesystem."""
-        logger.info("Rescanning projects from filesystem...")
-        self.projects.clear()
-        
-        if not PROJECTS_DIR.exists():
-            logger.warning(f"Projects directory not found: {PROJECTS_DIR}")
-            return
+        """Force a complete rescan of projects from filesystem.
+
+        Projects that are still present keep their URLs, display name and
+        running frontend PID; only what is detected on disk is refreshed.
+        The new list is built on the side and swapped in at the end, so the
+        scan can run in a worker thread while the UI keeps reading the old one.
+        """
+        with self._lock, self._stat_cache():
+            logger.info("Rescanning projects from filesystem...")
+            previous = self._by_name
+            projects: List[Project] = []
+            # Known projects keep their port and Redis DB, so new ones found
+            # before them in the scan must not be handed the same values
+            used_ports: Set[int] = {p.port for p in previous.values()}
+            used_dbs: Set[int] = {p.redis_db for p in previous.values() if p.redis_db is not None}
+
+            if not self._isdir(config.projects_dir()):
+                logger.warning("Projects directory not found: %s", config.projects_dir())
+                self.projects = projects
+                self._reindex()
+                return
             
-        for item in PROJECTS_DIR.iterdir():
-            if not item.is_dir():
-                continue
-                
-            name = item.name
-            logger.debug(f"Scanning project: {name}")
+            for item in self._iter_project_dirs():
+                name = item.name
+                logger.debug("Scanning project: %s", name)
             
-            # Check if it's a valid project directory
-            if not self._is_valid_project_dir(item):
-                continue
+                # Check if it's a valid project directory
+                if not self._is_valid_project_dir(item):
+                    continue
                 
-            # Detect Redis DB and port
-            redis_db = self._detect_redis_db(item) or self._get_next_redis_db()
-            detected_port = self._detect_port(item) or self._get_next_port()
+                # Detect Redis DB and port
+                redis_db = self._detect_redis_db(item)
+                detected_port = self._detect_port(item)
             
-            # Create and add project
-            project = Project(
-                name=name,
-                pretty_name=name.replace('-', ' ').title(),
-                directory=str(item),
-                port=detected_port,
-                redis_db=redis_db,
-                fe_url=f"https://app.{name}.test",
-                be_url=f"https://api.{name}.test"
-            )
-            self.projects.append(project)
-            logger.debug(f"Added project: {name} (port={detected_port}, redis_db={redis_db})")
+                if (project := previous.get(name)) is not None:
+                    # Keep the existing project, refreshing what was detected
+                    changes = {
+                        key: value
+                        for key, value in (
+                            ("redis_db", redis_db),
+                            ("port", detected_port),
+                            ("directory", item)
+                        )
+                        if value is not None and value != getattr(project, key)
+                    }
+                    if changes:
+                        project = replace(project, **changes)
+                    redis_db, detected_port = project.redis_db, project.port
+                else:
+                    if redis_db is None:
+                        redis_db = self._get_next_redis_db(used_dbs)
+                    if detected_port is None:
+                        detected_port = self._get_next_port(used_ports)
+
+                    # Create new project
+                    project = Project.with_default_urls(
+                        name=name,
+                        pretty_name=_pretty_name(name),
+                        port=detected_port,
+                        redis_db=redis_db,
+                        directory=item
+                    )
+                projects.append(project)
+                used_ports.add(project.port)
+                if project.redis_db is not None:
+                    used_dbs.add(project.redis_db)
+                logger.debug(
+                    "Added project: %s (port=%s, redis_db=%s)", name, detected_port, redis_db
+                )
+
+            self.projects = projects
+            self._reindex()
             
-        # Save updated projects
-        self.save_projects()
-        logger.info(f"Found {len(self.projects)} projects")
+            # Save updated projects
+            self.save_projects()
+            logger.info("Found %s projects", len(self.projects))
 
     def _detect_redis_db(self, project_dir: Path) -> Optional[int]:
         """Detect Redis DB from .env files."""
         for backend_dir in ['api', 'backend', 'server']:
             env_file = project_dir / backend_dir / '.env'
-            if env_file.is_file():
+            if self._isfile(env_file):
                 try:
                     env_content = env_file.read_text()
                     for line in env_content.splitlines():
                         if 'REDIS_DB=' in line:
                             redis_db = int(line.split('=')[1].strip())
-                            logger.debug(f"Found Redis DB {redis_db} in {env_file}")
+                            logger.debug("Found Redis DB %s in %s", redis_db, env_file)
                             return redis_db
                 except (ValueError, IndexError) as e:
-                    logger.warning(f"Failed to parse Redis DB value in {env_file}: {e}")
+                    logger.warning("Failed to parse Redis DB value in %s: %s", env_file, e)
                 except Exception as e:
-                    logger.error(f"Error reading {env_file}: {e}")
+                    logger.error("Error reading %s: %s", env_file, e)
         return None
 
     def _detect_port_from_package_json(self, pkg_file: Path) -> Optional[int]:
         """Detect port from package.json file."""
-        if not pkg_file.is_file():
+        if not self._isfile(pkg_file):
             return None
             
         try:
-            data = json.loads(pkg_file.read_text())
+            data = _read_json(pkg_file)
             scripts = data.get('scripts', {})
             
             # Check dev script first
             if 'dev' in scripts:
                 dev_script = scripts['dev']
                 if port := self._extract_port_from_script(dev_script):
-                    logger.debug(f"Found port {port} in dev script")
+                    logger.debug("Found port %s in dev script", port)
                     return port
             
             # Check other scripts
             for script_name, script in scripts.items():
                 if port := self._extract_port_from_script(script):
-                    logger.debug(f"Found port {port} in {script_name} script")
+                    logger.debug("Found port %s in %s script", port, script_name)
                     return port
                     
             return None
         except Exception as e:
-            logger.warning(f"Error parsing {pkg_file}: {e}")
+            logger.warning("Error parsing %s: %s", pkg_file, e)
             return None
 
     def _is_valid_project_dir(self, path: Path) -> bool:
@@ -654,24 +931,49 @@ class ProjectService:
         Returns:
             bool: True if directory contains a valid project structure
         """
-        if not path.is_dir():
+        if not self._isdir(path):
             return False
             
-        name = path.name
-        
-        # Check all possible directory structures
-        app_dir = path / f"{name}-app"
-        api_dir = path / f"{name}-api"
-        www_dir = path / "www"
-        standard_api_dir = path / "api"
-        plain_app_dir = path / "app"
-        
-        # Check all three possible structures
-        has_named_app_api = app_dir.exists() and api_dir.exists()
-        has_plain_app_api = plain_app_dir.exists() and standard_api_dir.exists()
-        has_www_api = www_dir.exists() and standard_api_dir.exists()
+        return self._detect_structure(path, path.name) is not None
+
+    def _detect_structure(self, path: Union[str, Path], name: str) -> Optional[Layout]:
+        """Find which of the supported app/api layouts a directory uses.
+
+        The layouts are <name>-app + <name>-api, app + api and www + api, in
+        that order of preference. The directory is listed once instead of
+        probing every candidate subdirectory.
+
+        Args:
+            path: Project directory
+            name: Project name
+
+        Returns:
+            The (frontend, backend) subdirectory names, or None if no
+            supported layout is present
+
+        """
+        base = os.fspath(path)
+        key = (base, name)
+        if self._layout_cache is not None and key in self._layout_cache:
+            return self._layout_cache[key]
         
-        return has_named_app_api or has_plain_app_api or has_www_api
+        try:
+            with os.scandir(base) as entries:
+                subdirs = {entry.name for entry in entries if entry.is_dir()}
+        except OSError:
+            subdirs = set()
+
+        layout = next(
+            (
+                (fe, be)
+                for fe, be in ((f"{name}-app", f"{name}-api"), ("app", "api"), ("www", "api"))
+                if fe in subdirs and be in subdirs
+            ),
+            None
+        )
+        if self._layout_cache is not None:
+            self._layout_cache[key] = layout
+        return layout
 
     def _detect_port(self, project_dir: Path) -> Optional[int]:
         """Detect port from project files.
@@ -2,20 +2,139 @@ from pathlib import Path
 import os
 import subprocess
 import random
-import json
-from typing import Callable, Optional
+import re
+import shlex
+import shutil
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Union
 import pymysql
-from pymysql.err import Error
+from pymysql.err import Error, InterfaceError, OperationalError
 
-from ..utils.config import NEW_PROJECT_SCRIPT
+from ..utils.config import OFFLINE_INSTALL
+from ..utils.process import POSIX_SPAWN_KWARGS, resolve_executable
+from ..utils.serialization import dumps, loads
+
+# Bytes read from a command's output pipe at a time
+_READ_CHUNK_SIZE = 32768
+
+# Connection parameters of the local MySQL server; only single DDL
+# statements are run, which MySQL commits implicitly anyway
+_DB_CONNECT_KWARGS: Dict[str, Any] = {
+    'host': '127.0.0.1',
+    'user': 'root',
+    'password': '',
+    'charset': 'utf8mb4',
+    'autocommit': True
+}
+
+# Threads used to delete the subtrees of a project directory
+_RMTREE_WORKERS = 8
+# Dependency directories that hold most of a project's files
+_DEPENDENCY_DIRS = frozenset({'node_modules', 'vendor'})
+
+# VS Code settings written to both repositories of a new project
+_VSCODE_SETTINGS: Dict[str, Any] = {
+    "cSpell.words": ["superadmin"]
+}
+# Title and status bar colors of the editor window, filled with the project color
+_VSCODE_COLOR_TEMPLATES = {
+    "statusBar.background": "#{color}",
+    "statusBar.foreground": "#ffffff",
+    "titleBar.activeBackground": "#{color}",
+    "titleBar.activeForeground": "#ffffff",
+    "titleBar.inactiveBackground": "#{color}",
+    "titleBar.inactiveForeground": "#e7e7e799"
+}
+
+# Template values in the frontend .env that are replaced for a new project
+_FRONTEND_ENV_RE = re.compile(r'https://api\.saasdev\.test|https://saasdev\.test|SaasDev')
+
+# Backend .env keys set for a new project, with templates for their values
+_BACKEND_ENV_TEMPLATES = {
+    'DB_DATABASE': '{app_name}',
+    'APP_NAME': '"{app_name_pretty}"',
+    'APP_URL': 'https://api.{app_name}.test',
+    'FRONTEND_URL': 'https://app.{app_name}.test',
+    'CORS_ALLOWED_ORIGIN': 'https://app.{app_name}.test',
+    'SANCTUM_STATEFUL_DOMAINS': 'https://app.{app_name}.test',
+    'SESSION_DOMAIN': '.{app_name}.test',
+    'REDIS_CACHE_DB': '{redis_db}',
+    'REDIS_DB': '{redis_db}'
+}
+# Matches any of the keys above with its value, so the file is rewritten in one pass
+_BACKEND_ENV_RE = re.compile(f"({'|'.join(_BACKEND_ENV_TEMPLATES)})=.*")
 
 
 class ScriptService:
-    """Service for executing shell scripts and capturing their output."""
+    """Service for executing shell scripts and capturing their output.
+
+    Commands are launched so that subprocess can use posix_spawn() rather
+    than fork()+exec(); never pass preexec_fn, which forces the slow path.
+    They run without a shell unless one is asked for explicitly, saving a
+    /bin/sh process per command.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the ScriptService."""
+        # One MySQL connection, opened on first use and shared by all
+        # database operations; the lock keeps threads from interleaving on it
+        self._db_connection: Optional[pymysql.connections.Connection] = None
+        self._db_lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state; the connection and lock stay behind."""
+        state = self.__dict__.copy()
+        del state['_db_connection'], state['_db_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore the state with a fresh, not yet opened connection."""
+        self.__dict__.update(state)
+        self._db_connection = None
+        self._db_lock = threading.Lock()
+
+    def _execute_sql(self, statement: str) -> None:
+        """Run a statement on the shared MySQL connection.
+
+        The connection is opened on first use and kept for later calls. A
+        kept connection the server dropped while idle makes the statement fail
+        with a connection error; it is then reopened and the statement run
+        once more, which is safe for the idempotent DDL run here. Any other
+        failure closes the connection so the next call starts afresh.
+
+        Args:
+            statement: SQL statement to run
+
+        """
+        with self._db_lock:
+            try:
+                if self._db_connection is None:
+                    self._db_connection = pymysql.connect(**_DB_CONNECT_KWARGS)
+                    self._execute_on_connection(statement)
+                    return
+                try:
+                    self._execute_on_connection(statement)
+                except (OperationalError, InterfaceError):
+                    self._db_connection.close()
+                    self._db_connection = pymysql.connect(**_DB_CONNECT_KWARGS)
+                    self._execute_on_connection(statement)
+            except Error:
+                if self._db_connection is not None and self._db_connection.open:
+                    self._db_connection.close()
+                self._db_connection = None
+                raise
+
+    def _execute_on_connection(self, statement: str) -> None:
+        """Run a statement on the current connection; called with the lock held."""
+        with self._db_connection.cursor() as cursor:
+            cursor.execute(statement)
 
     def _run_command(
         self, 
-        command: str, 
+        command: Union[str, Sequence[str]],
         output_callback: Optional[Callable[[str], None]] = None,
         cwd: Optional[Path] = None,
         check: bool = True
@@ -23,7 +142,9 @@ class ScriptService:
         """Run a command and stream its output.
         
         Args:
-            command: Command to run
+            command: Command to run, either a string split with shell
+                quoting rules or a list of arguments; it is not run by a
+                shell, so use _run_chain for anything that needs one
             output_callback: Callback for output
             cwd: Working directory
             check: Whether to raise on error
@@ -34,33 +155,75 @@ class ScriptService:
         Raises:
             subprocess.CalledProcessError: If command fails and check=True
         """
+        if isinstance(command, str):
+            args = shlex.split(command)
+        else:
+            args = list(command)
+            command = shlex.join(args)
+
         if output_callback:
             output_callback(f"$ {command}")
-            
-        process = subprocess.Popen(
-            command,
-            shell=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            cwd=cwd,
-            bufsize=1  # Line buffered
-        )
         
-        output_lines = []
-        while True:
-            line = process.stdout.readline()
-            if not line and process.poll() is not None:
-                break
-            if line:
-                line = line.strip()
+        try:
+            process = subprocess.Popen(
+                [resolve_executable(args[0]), *args[1:]],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                cwd=cwd,
+                **POSIX_SPAWN_KWARGS
+            )
+        except FileNotFoundError:
+            # Report a missing tool like a shell would
+            message = f"{args[0]}: command not found"
+            if output_callback:
+                output_callback(message)
+            return self._command_finished(command, 127, [message], output_callback, check)
+
+        # Drain the pipe in large chunks and split lines ourselves rather
+        # than paying a readline() call per line
+        output_lines: List[str] = []
+        fd = process.stdout.fileno()
+        pending = b''
+        while chunk := os.read(fd, _READ_CHUNK_SIZE):
+            *lines, pending = (pending + chunk).split(b'\n')
+            for raw in lines:
+                line = raw.decode('utf-8', 'replace').strip()
                 output_lines.append(line)
                 if output_callback:
                     output_callback(line)
+        if pending:
+            line = pending.decode('utf-8', 'replace').strip()
+            output_lines.append(line)
+            if output_callback:
+                output_callback(line)
                     
         process.stdout.close()
-        return_code = process.wait()
+        return self._command_finished(command, process.wait(), output_lines, output_callback, check)
+
+    def _command_finished(
+        self,
+        command: str,
+        return_code: int,
+        output_lines: List[str],
+        output_callback: Optional[Callable[[str], None]],
+        check: bool
+    ) -> subprocess.CompletedProcess:
+        """Build the result of a finished command.
         
+        Args:
+            command: Command that ran
+            return_code: Exit code of the command
+            output_lines: Lines the command printed
+            output_callback: Callback for output
+            check: Whether to raise on error
+
+        Returns:
+            CompletedProcess instance
+
+        Raises:
+            subprocess.CalledProcessError: If command failed and check=True
+
+        """
         if check and return_code != 0:
             error_msg = '\n'.join(output_lines)
             if output_callback:
@@ -74,13 +237,31 @@ class ScriptService:
             command, return_code, '\n'.join(output_lines)
         )
 
+    def _run_chain(
+        self,
+        commands: Sequence[str],
+        output_callback: Optional[Callable[[str], None]] = None,
+        cwd: Optional[Path] = None
+    ) -> subprocess.CompletedProcess:
+        """Run commands one after another in a single bash, stopping at the first failure.
+
+        Args:
+            commands: Commands to run
+            output_callback: Callback for output
+            cwd: Working directory
+
+        Returns:
+            CompletedProcess instance
+
+        Raises:
+            subprocess.CalledProcessError: If any of the commands fails
+
+        """
+        return self._run_command(['bash', '-c', ' && '.join(commands)], output_callback, cwd=cwd)
+
     def _generate_random_color(self) -> str:
         """Generate a random color hex code."""
-        return '%02x%02x%02x' % (
-            random.randint(0, 255),
-            random.randint(0, 255),
-            random.randint(0, 255)
-        )
+        return f'{random.randrange(0x1000000):06x}'
 
     def _update_vscode_settings(
         self, 
@@ -97,18 +278,14 @@ class ScriptService:
         
         settings_file = settings_dir / "settings.json"
         settings = {
-            "cSpell.words": ["superadmin"],
+            **_VSCODE_SETTINGS,
             "workbench.colorCustomizations": {
-                "statusBar.background": f"#{color}",
-                "statusBar.foreground": "#ffffff",
-                "titleBar.activeBackground": f"#{color}",
-                "titleBar.activeForeground": "#ffffff",
-                "titleBar.inactiveBackground": f"#{color}",
-                "titleBar.inactiveForeground": "#e7e7e799"
+                key: template.format(color=color)
+                for key, template in _VSCODE_COLOR_TEMPLATES.items()
             }
         }
         
-        settings_file.write_text(json.dumps(settings, indent=2))
+        settings_file.write_bytes(dumps(settings, indent=True))
 
     def _create_database(
         self, 
@@ -120,24 +297,13 @@ class ScriptService:
             output_callback(f"Creating database {db_name}...")
             
         try:
-            connection = pymysql.connect(
-                host="127.0.0.1",
-                user="root",
-                password="",
-                charset='utf8mb4'
-            )
-            with connection.cursor() as cursor:
-                cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{db_name}`")
-            connection.commit()
+            self._execute_sql(f"CREATE DATABASE IF NOT EXISTS `{db_name}`")
             if output_callback:
                 output_callback(f"Database {db_name} created successfully")
         except Error as e:
             if output_callback:
                 output_callback(f"Error creating database: {e}")
             raise
-        finally:
-            if 'connection' in locals() and connection:
-                connection.close()
 
     def _drop_database(
         self, 
@@ -149,24 +315,13 @@ class ScriptService:
             output_callback(f"Dropping database {db_name}...")
             
         try:
-            connection = pymysql.connect(
-                host="127.0.0.1",
-                user="root",
-                password="",
-                charset='utf8mb4'
-            )
-            with connection.cursor() as cursor:
-                cursor.execute(f"DROP DATABASE IF EXISTS `{db_name}`")
-            connection.commit()
+            self._execute_sql(f"DROP DATABASE IF EXISTS `{db_name}`")
             if output_callback:
                 output_callback(f"Database {db_name} dropped successfully")
         except Error as e:
             if output_callback:
                 output_callback(f"Error dropping database: {e}")
             raise
-        finally:
-            if 'connection' in locals() and connection:
-                connection.close()
 
     def delete_project(
         self,
@@ -192,12 +347,11 @@ class ScriptService:
             # Delete GitHub repositories
             if output_callback:
                 output_callback("\nDeleting GitHub repositories...")
-            self._run_command(
-                f'gh repo delete --yes petarjs/{app_name}-api',
-                output_callback
-            )
-            self._run_command(
-                f'gh repo delete --yes petarjs/{app_name}-app',
+            self._run_parallel(
+                [
+                    partial(self._run_command, f'gh repo delete --yes petarjs/{app_name}-{suffix}')
+                    for suffix in ('api', 'app')
+                ],
                 output_callback
             )
             
@@ -220,8 +374,7 @@ class ScriptService:
                 output_callback("\nDeleting project directory...")
             project_dir = Path.home() / "projects" / "personal" / app_name
             if project_dir.exists():
-                import shutil
-                shutil.rmtree(project_dir)
+                self._remove_tree(project_dir)
                 if output_callback:
                     output_callback(f"Deleted directory: {project_dir}")
             
@@ -235,6 +388,222 @@ class ScriptService:
                 output_callback(f"\nError deleting project: {str(e)}")
             return False
 
+    def _remove_tree(self, root: Path) -> None:
+        """Delete a directory tree, removing its subtrees concurrently.
+
+        Deleting node_modules and vendor is bound by unlink latency rather
+        than CPU, so working on several subtrees at once overlaps the
+        filesystem calls.
+
+        Args:
+            root: Directory to delete
+
+        """
+        def subdirs(path: Path) -> Iterator[Path]:
+            return (child for child in path.iterdir() if child.is_dir() and not child.is_symlink())
+
+        # Split <root>/<repo>/<dir>, and each package inside node_modules and
+        # vendor, into separate jobs. pnpm keeps every package in the
+        # node_modules/.pnpm store and only symlinks to it from node_modules,
+        # so the store is split per package as well
+        subtrees = []
+        for repo in subdirs(root):
+            for directory in subdirs(repo):
+                if directory.name not in _DEPENDENCY_DIRS:
+                    subtrees.append(directory)
+                    continue
+                for package in subdirs(directory):
+                    if package.name == '.pnpm':
+                        subtrees.extend(subdirs(package))
+                    else:
+                        subtrees.append(package)
+
+        with ThreadPoolExecutor(max_workers=_RMTREE_WORKERS) as executor:
+            # Errors are ignored here; the final rmtree reports anything left
+            list(executor.map(partial(shutil.rmtree, ignore_errors=True), subtrees))
+        shutil.rmtree(root)
+
+    def _run_parallel(
+        self,
+        steps: Sequence[Callable[[Optional[Callable[[str], None]]], None]],
+        output_callback: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """Run independent chains of steps concurrently.
+
+        Each chain runs in its own worker thread and reports its output
+        through a queue. The calling thread relays the lines to
+        output_callback, so callbacks that touch Tk widgets stay on the
+        thread that owns them.
+
+        Args:
+            steps: Chains to run; each receives the output callback to use
+            output_callback: Callback for output
+
+        Raises:
+            Exception: The first error raised by a chain, once all have ended
+
+        """
+        lines: queue.SimpleQueue = queue.SimpleQueue()
+        emit = lines.put if output_callback else None
+
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step, emit) for step in steps]
+            if output_callback:
+                while not all(future.done() for future in futures):
+                    try:
+                        output_callback(lines.get(timeout=0.05))
+                    except queue.Empty:
+                        pass
+                # Lines written after the last poll
+                while not lines.empty():
+                    output_callback(lines.get_nowait())
+
+        for future in futures:
+            future.result()
+
+    def _setup_frontend(
+        self,
+        app_name: str,
+        app_name_pretty: str,
+        port: int,
+        project_dir: Path,
+        output_callback: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """Create and configure the frontend repository of a new project."""
+        self._run_command(
+            f'gh repo create {app_name}-app --template petarjs/www.saasdev --private --clone',
+            output_callback,
+            cwd=project_dir
+        )
+
+        # Frontend setup
+        if output_callback:
+            output_callback("\nSetting up frontend...")
+
+        frontend_dir = project_dir / f"{app_name}-app"
+
+        # Both templates are installed over and over, so their packages are
+        # nearly always in the local stores already
+        self._run_command(
+            f"pnpm install {'--offline' if OFFLINE_INSTALL else '--prefer-offline'}",
+            output_callback,
+            cwd=frontend_dir
+        )
+
+        # Update package.json
+        pkg_file = frontend_dir / "package.json"
+        pkg_data = loads(pkg_file.read_bytes())
+
+        # Update scripts that contain port number
+        scripts = pkg_data.get('scripts', {})
+        updated_scripts = {
+            key: script.replace('-p 3000', f'-p {port}')
+            for key, script in scripts.items()
+        }
+
+        if updated_scripts != scripts or pkg_data.get('name') != app_name:
+            if scripts:
+                pkg_data['scripts'] = updated_scripts
+            pkg_data['name'] = app_name
+            pkg_file.write_bytes(dumps(pkg_data, indent=True))
+
+        # Set up frontend proxy
+        if output_callback:
+            output_callback("Setting up frontend proxy...")
+        self._run_command(
+            f'herd proxy --secure app.{app_name} http://localhost:{port}',
+            output_callback
+        )
+
+        # Set up frontend .env
+        env_example = frontend_dir / ".env.example"
+        env_local = frontend_dir / ".env.local"
+
+        if env_example.exists():
+            values = {
+                'https://api.saasdev.test': f'https://api.{app_name}.test',
+                'https://saasdev.test': f'https://app.{app_name}.test',
+                'SaasDev': app_name_pretty
+            }
+            env_content = _FRONTEND_ENV_RE.sub(
+                lambda match: values[match.group(0)], env_example.read_text()
+            )
+            env_local.write_text(env_content)
+
+    def _setup_backend(
+        self,
+        app_name: str,
+        app_name_pretty: str,
+        redis_db: int,
+        project_dir: Path,
+        output_callback: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """Create and configure the backend repository of a new project."""
+        self._run_command(
+            f'gh repo create {app_name}-api --template petarjs/api.saasdev --private --clone',
+            output_callback,
+            cwd=project_dir
+        )
+
+        # Backend setup
+        if output_callback:
+            output_callback("\nSetting up backend...")
+
+        backend_dir = project_dir / f"{app_name}-api"
+
+        # Create database
+        self._create_database(app_name, output_callback)
+
+        # Set up backend proxy
+        if output_callback:
+            output_callback("Setting up backend proxy...")
+        self._run_command(
+            f'herd link --secure api.{app_name}.test',
+            output_callback
+        )
+
+        # Set up backend .env
+        env_example = backend_dir / ".env.example"
+        env_file = backend_dir / ".env"
+
+        if env_example.exists():
+            env_content = env_example.read_text()
+            values = {
+                key: f'{key}=' + template.format(
+                    app_name=app_name,
+                    app_name_pretty=app_name_pretty,
+                    redis_db=redis_db
+                )
+                for key, template in _BACKEND_ENV_TEMPLATES.items()
+            }
+            env_content = _BACKEND_ENV_RE.sub(lambda match: values[match.group(1)], env_content)
+            env_file.write_text(env_content)
+
+        # Install backend dependencies
+        if output_callback:
+            output_callback("Installing backend dependencies...")
+        self._run_command(
+            'composer install --prefer-dist --no-progress --no-interaction',
+            output_callback,
+            cwd=backend_dir
+        )
+
+        # Set up Laravel
+        if output_callback:
+            output_callback("Setting up Laravel...")
+        self._run_chain(
+            [
+                'php artisan key:generate',
+                'php artisan migrate:fresh --seed',
+                'php artisan storage:link',
+                # Set up IP Info
+                'mkdir -p storage/app/ipinfo',
+                'php artisan ipinfo:update'
+            ],
+            output_callback,
+            cwd=backend_dir
+        )
+
     def execute_new_project_script(
         self,
         app_name: str,
@@ -243,10 +612,16 @@ class ScriptService:
         redis_db: int,
         output_callback: Optional[Callable[[str], None]] = None
     ) -> bool:
-        """Create a new project with the given parameters."""
+        """Create a new project with the given parameters.
+
+        The frontend and backend are set up concurrently; output_callback is
+        only ever called from the calling thread.
+        """
         try:
             projects_dir = Path.home() / "projects" / "personal"
             project_dir = projects_dir / app_name
+            frontend_dir = project_dir / f"{app_name}-app"
+            backend_dir = project_dir / f"{app_name}-api"
             
             # Log project details
             if output_callback:
@@ -260,123 +635,27 @@ class ScriptService:
             # Create project directory
             project_dir.mkdir(exist_ok=True)
             
-            # Create repositories
+            # Create repositories and set them up, frontend and backend in parallel
             if output_callback:
                 output_callback("Creating repositories...")
-                
-            self._run_command(
-                f'gh repo create {app_name}-api --template petarjs/api.saasdev --private --clone',
-                output_callback,
-                cwd=project_dir
-            )
-            self._run_command(
-                f'gh repo create {app_name}-app --template petarjs/www.saasdev --private --clone',
-                output_callback,
-                cwd=project_dir
-            )
-            
-            # Frontend setup
-            if output_callback:
-                output_callback("\nSetting up frontend...")
-                
-            frontend_dir = project_dir / f"{app_name}-app"
-            
-            self._run_command('pnpm i', output_callback, cwd=frontend_dir)
-            
-            # Update package.json
-            pkg_file = frontend_dir / "package.json"
-            with open(pkg_file) as f:
-                pkg_data = json.load(f)
             
-            # Update scripts that contain port number
-            for script in pkg_data.get('scripts', {}).values():
-                if '-p 3000' in script:
-                    script.replace('-p 3000', f'-p {port}')
-            pkg_data['name'] = app_name
-            
-            with open(pkg_file, 'w') as f:
-                json.dump(pkg_data, f, indent=2)
-            
-            # Set up frontend proxy
-            if output_callback:
-                output_callback("Setting up frontend proxy...")
-            self._run_command(
-                f'herd proxy --secure app.{app_name} http://localhost:{port}',
+            self._run_parallel(
+                [
+                    partial(self._setup_frontend, app_name, app_name_pretty, port, project_dir),
+                    partial(self._setup_backend, app_name, app_name_pretty, redis_db, project_dir)
+                ],
                 output_callback
             )
             
-            # Set up frontend .env
-            env_example = frontend_dir / ".env.example"
-            env_local = frontend_dir / ".env.local"
-            
-            if env_example.exists():
-                env_content = env_example.read_text()
-                env_content = env_content.replace('https://api.saasdev.test', f'https://api.{app_name}.test')
-                env_content = env_content.replace('https://saasdev.test', f'https://app.{app_name}.test')
-                env_content = env_content.replace('SaasDev', app_name_pretty)
-                env_local.write_text(env_content)
-            
-            # Backend setup
-            if output_callback:
-                output_callback("\nSetting up backend...")
-                
-            backend_dir = project_dir / f"{app_name}-api"
-            
-            # Create database
-            self._create_database(app_name, output_callback)
-            
-            # Set up backend proxy
-            if output_callback:
-                output_callback("Setting up backend proxy...")
-            self._run_command(
-                f'herd link --secure api.{app_name}.test',
-                output_callback
-            )
-            
-            # Set up backend .env
-            env_example = backend_dir / ".env.example"
-            env_file = backend_dir / ".env"
-            
-            if env_example.exists():
-                env_content = env_example.read_text()
-                replacements = {
-                    'DB_DATABASE=.*': f'DB_DATABASE={app_name}',
-                    'APP_NAME=.*': f'APP_NAME="{app_name_pretty}"',
-                    'APP_URL=.*': f'APP_URL=https://api.{app_name}.test',
-                    'FRONTEND_URL=.*': f'FRONTEND_URL=https://app.{app_name}.test',
-                    'CORS_ALLOWED_ORIGIN=.*': f'CORS_ALLOWED_ORIGIN=https://app.{app_name}.test',
-                    'SANCTUM_STATEFUL_DOMAINS=.*': f'SANCTUM_STATEFUL_DOMAINS=https://app.{app_name}.test',
-                    'SESSION_DOMAIN=.*': f'SESSION_DOMAIN=.{app_name}.test',
-                    'REDIS_CACHE_DB=.*': f'REDIS_CACHE_DB={redis_db}',
-                    'REDIS_DB=.*': f'REDIS_DB={redis_db}'
-                }
-                
-                for pattern, replacement in replacements.items():
-                    import re
-                    env_content = re.sub(pattern, replacement, env_content)
-                    
-                env_file.write_text(env_content)
-            
-            # Install backend dependencies
-            if output_callback:
-                output_callback("Installing backend dependencies...")
-            self._run_command('composer install', output_callback, cwd=backend_dir)
-            
-            # Set up Laravel
-            if output_callback:
-                output_callback("Setting up Laravel...")
-            self._run_command('php artisan key:generate', output_callback, cwd=backend_dir)
-            self._run_command('php artisan migrate:fresh --seed', output_callback, cwd=backend_dir)
-            self._run_command('php artisan storage:link', output_callback, cwd=backend_dir)
-            
-            # Set up IP Info
-            (backend_dir / "storage/app/ipinfo").mkdir(parents=True, exist_ok=True)
-            self._run_command('php artisan ipinfo:update', output_callback, cwd=backend_dir)
-            
             # Update VS Code settings for both directories
             color = self._generate_random_color()
-            self._update_vscode_settings(frontend_dir, color, output_callback)
-            self._update_vscode_settings(backend_dir, color, output_callback)
+            self._run_parallel(
+                [
+                    partial(self._update_vscode_settings, directory, color)
+                    for directory in (frontend_dir, backend_dir)
+                ],
+                output_callback
+            )
             
             # Final output
             if output_callback:
@@ -397,4 +676,4 @@ class ScriptService:
         except Exception as e:
             if output_callback:
                 output_callback(f"\nError: {str(e)}")
-            return False 
\ No newline at end of file
+            return False
\ No newline at end of file
@@ -1,8 +1,10 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import logging
+from functools import partial
 
 from .base import BaseComponent
+from .script_output import ScriptOutput
 from ...services.project_service import ProjectService
 from ...services.script_service import ScriptService
 
@@ -42,16 +44,19 @@ class NewProjectForm(BaseComponent):
         self.pretty_name_entry.grid(row=1, column=1, sticky='w', padx=5, pady=5)
         
         # Create button
-        ttk.Button(form, text="Create Project", command=self._create_project).grid(
-            row=2, column=0, columnspan=2, pady=20
-        )
+        self.create_button = ttk.Button(form, text="Create Project", command=self._create_project)
+        self.create_button.grid(row=2, column=0, columnspan=2, pady=20)
         
         # Output area
         self.output_text = tk.Text(self.frame, height=10, width=60)
         self.output_text.pack(padx=20, pady=10, fill='both', expand=True)
+        self.output = ScriptOutput(self.output_text)
 
     def _create_project(self) -> None:
         """Handle project creation."""
+        if self.output.running:
+            return
+
         name = self.name_entry.get().strip()
         pretty_name = self.pretty_name_entry.get().strip()
         
@@ -62,38 +67,40 @@ class NewProjectForm(BaseComponent):
         # Clear output
         self.output_text.delete(1.0, tk.END)
         
-        def output_callback(line: str) -> None:
-            """Callback to handle script output."""
-            self.output_text.insert(tk.END, f"{line}\n")
-            self.output_text.see(tk.END)  # Scroll to bottom
-            self.output_text.update()  # Force update
-        
         try:
             # Get next available port and Redis DB
             port = self.project_service._get_next_port()
             redis_db = self.project_service._get_next_redis_db()
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+
+        self.create_button.state(['disabled'])
+        self.output.run(
+            partial(
+                self.script_service.execute_new_project_script, name, pretty_name, port, redis_db
+            ),
+            self._finish_project
+        )
+
+    def _finish_project(self, success: bool) -> None:
+        """Report the result of the script that just ended.
+
+        Args:
+            success: Whether the project was created
+
+        """
+        self.create_button.state(['!disabled'])
+
+        if success:
+            # Clear form fields
+            self.name_entry.delete(0, tk.END)
+            self.pretty_name_entry.delete(0, tk.END)
             
-            # Execute script with output callback
-            success = self.script_service.execute_new_project_script(
-                name,
-                pretty_name,
-                port,
-                redis_db,
-                output_callback
-            )
+            # Reload projects from filesystem
+            self.project_service._load_projects()
             
-            if success:
-                # Clear form fields
-                self.name_entry.delete(0, tk.END)
-                self.pretty_name_entry.delete(0, tk.END)
-                
-                # Reload projects from filesystem
-                self.project_service._load_projects()
-                
-                messagebox.showinfo("Success", "Project created successfully!")
-                self.on_project_created()  # Refresh projects list
-            else:
-                messagebox.showerror("Error", "Failed to create project")
-                
-        except ValueError as e:
-            messagebox.showerror("Error", str(e)) 
\ No newline at end of file
+            messagebox.showinfo("Success", "Project created successfully!")
+            self.on_project_created()  # Refresh projects list
+        else:
+            messagebox.showerror("Error", "Failed to create project")
\ No newline at end of file
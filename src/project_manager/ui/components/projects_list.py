@@ -3,17 +3,64 @@ from tkinter import ttk, messagebox
 import logging
 import webbrowser
 import subprocess
-from typing import Optional
+import queue
+import threading
+from functools import partial
+from typing import Callable, Dict, Optional, Tuple
 from pathlib import Path
+import psutil
 
 from .base import BaseComponent
+from .edit_dialog import EditDialog
+from .script_output import ScriptOutput
 from .toast import Toast
 from ...models.project import Project
 from ...services.project_service import ProjectService
 from ...services.script_service import ScriptService
+from ...utils.output_poller import OutputPoller
+from ...utils.process import POSIX_SPAWN_KWARGS, resolve_executable
 
 logger = logging.getLogger(__name__)
 
+# Table columns with their heading, initial width and whether they take up
+# extra space when the window is resized
+COLUMNS = {
+    "name": ("Name", 160, True),
+    "pretty": ("Display Name", 220, True),
+    "port": ("Port", 70, False),
+    "redis": ("Redis DB", 70, False),
+}
+
+# Frontend dev server output is logged in batches this often
+FE_LOG_POLL_MS = 50
+# Lines of frontend output buffered at most; more are dropped until drained
+FE_LOG_QUEUE_SIZE = 10000
+
+# How often a running rescan is checked for completion
+RESCAN_POLL_MS = 50
+# How often a frontend being stopped is checked for having exited
+FE_STOP_POLL_MS = 50
+
+# Tag of the rows whose frontend dev server is running
+RUNNING_TAG = "running"
+RUNNING_BACKGROUND = "#e6ffe6"
+
+# Question asked before a project and all its resources are deleted
+DELETE_CONFIRM_TEMPLATE = (
+    "Are you sure you want to delete the project '{name}'?\n\n"
+    "This will:\n"
+    "- Delete the project directory\n"
+    "- Delete GitHub repositories\n"
+    "- Drop the database\n"
+    "- Remove Herd proxies\n\n"
+    "This action cannot be undone!"
+)
+
+# Indices of the actions menu entries that change per project
+MENU_TOGGLE_FE = 0
+MENU_OPEN_FE = 2
+MENU_OPEN_BE = 3
+
 class ProjectsList(BaseComponent):
     """Projects list component with actions."""
 
@@ -34,333 +81,478 @@ class ProjectsList(BaseComponent):
         self.project_service = project_service
         self.script_service = script_service
         self.toast = Toast(self.frame)
+        # Values and tags currently shown for each project, in table order
+        self._rows: Dict[str, Tuple[Tuple, Tuple[str, ...]]] = {}
+        # Project shown in each row, and the one the actions menu was opened for
+        self._projects: Dict[str, Project] = {}
+        self._menu_project: Optional[Project] = None
+        # Frontend directory of each project, found on the first start
+        self._fe_dir_cache: Dict[str, Path] = {}
+        self._rescan_thread: Optional[threading.Thread] = None
+        # Frontends being stopped by a worker thread: None until the worker
+        # is done, then whether the process was stopped
+        self._fe_stopping: Dict[str, Optional[bool]] = {}
+        # Deletion progress dialog, see _get_delete_dialog
+        self._delete_dialog: Optional[tk.Toplevel] = None
+        # Frontend output read by the output poller, logged by the Tk thread
+        self._fe_log: queue.Queue = queue.Queue(maxsize=FE_LOG_QUEUE_SIZE)
+        self._fe_log_scheduled = False
+        # One thread reads the output of every frontend started from here
+        self._output_poller = OutputPoller()
         self._setup_ui()
         self.load_projects()
 
     def _setup_ui(self) -> None:
         """Set up the component UI."""
-        # Create main container with scrollbar
-        self.canvas = tk.Canvas(self.frame)
-        scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.canvas.yview)
-        self.scrollable_frame = ttk.Frame(self.canvas)
+        # Styles live in Tk's global style database; configure them once here
+        style = ttk.Style(self.frame)
+        style.configure("Treeview.Heading", font=('Arial', 10, 'bold'))
+        style.configure("Danger.TButton", foreground='red')
         
         # Add refresh button at the top
         refresh_frame = ttk.Frame(self.frame)
         refresh_frame.pack(fill='x', padx=5, pady=5)
         
-        refresh_btn = ttk.Button(
+        self.refresh_btn = ttk.Button(
             refresh_frame,
             text="↻ Refresh",
             command=self._refresh_projects
         )
-        refresh_btn.pack(side='right')
+        self.refresh_btn.pack(side='right')
         
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # One native table widget; Tk only draws the rows that are visible
+        self.tree = ttk.Treeview(
+            self.frame, columns=tuple(COLUMNS), show="headings", selectmode="browse"
         )
+        scrollbar = ttk.Scrollbar(self.frame, orient="vertical", command=self.tree.yview)
+        self.tree.configure(yscrollcommand=scrollbar.set)
+        self.tree.tag_configure(RUNNING_TAG, background=RUNNING_BACKGROUND)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
-        
-        # Configure column weights to control stretching
-        self.scrollable_frame.grid_columnconfigure(0, weight=2)  # Name
-        self.scrollable_frame.grid_columnconfigure(1, weight=3)  # Display Name
-        self.scrollable_frame.grid_columnconfigure(2, weight=1)  # Port
-        self.scrollable_frame.grid_columnconfigure(3, weight=1)  # Redis DB
-        self.scrollable_frame.grid_columnconfigure(4, weight=2)  # Actions
-        
-        # Create headers
-        style = ttk.Style()
-        style.configure("Header.TLabel", font=('Arial', 10, 'bold'))
+        # Configure column widths to control stretching
+        for column, (heading, width, stretch) in COLUMNS.items():
+            self.tree.heading(column, text=heading, anchor='w')
+            self.tree.column(
+                column, width=width, minwidth=20 if stretch else width, stretch=stretch, anchor='w'
+            )
         
-        ttk.Label(self.scrollable_frame, text="Name", style="Header.TLabel").grid(
-            row=0, column=0, padx=5, pady=5, sticky='ew'
-        )
-        ttk.Label(self.scrollable_frame, text="Display Name", style="Header.TLabel").grid(
-            row=0, column=1, padx=5, pady=5, sticky='ew'
-        )
-        ttk.Label(self.scrollable_frame, text="Port", style="Header.TLabel").grid(
-            row=0, column=2, padx=5, pady=5, sticky='ew'
-        )
-        ttk.Label(self.scrollable_frame, text="Redis DB", style="Header.TLabel").grid(
-            row=0, column=3, padx=5, pady=5, sticky='ew'
-        )
-        ttk.Label(self.scrollable_frame, text="Actions", style="Header.TLabel").grid(
-            row=0, column=4, padx=5, pady=5, sticky='ew'
+        # Actions for the clicked project, built once and relabelled per project
+        self.actions_menu = tk.Menu(self.tree, tearoff=0)
+        actions = (
+            ("Start FE", self._toggle_frontend_process),
+            None,
+            ("Open Frontend", self._open_fe_url),
+            ("Open Backend", self._open_be_url),
+            ("Open in Cursor", self._open_in_cursor),
+            ("Edit", self._edit_project),
+            None,
+            ("🗑️ Delete", self._delete_project),
         )
+        for action in actions:
+            if action is None:
+                self.actions_menu.add_separator()
+            else:
+                label, handler = action
+                self.actions_menu.add_command(
+                    label=label, command=partial(self._run_action, handler)
+                )
+
+        # Button-2 is the right mouse button on macOS, Button-3 elsewhere
+        for sequence in ("<Button-2>", "<Button-3>", "<Double-1>"):
+            self.tree.bind(sequence, self._show_actions)
         
-        # Pack canvas and scrollbar
-        self.canvas.pack(side="left", fill="both", expand=True)
+        # Pack table and scrollbar
+        self.tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-    def _create_row(self, row_num: int, project: Project) -> None:
-        """Create a row in the projects list."""
-        # Project name
-        ttk.Label(self.scrollable_frame, text=project.name).grid(
-            row=row_num, column=0, padx=5, pady=5, sticky='ew'
-        )
+    def _run_action(self, handler: Callable[[Project], None]) -> None:
+        """Run a menu action for the project the menu was opened for.
         
-        # Display name
-        ttk.Label(self.scrollable_frame, text=project.pretty_name).grid(
-            row=row_num, column=1, padx=5, pady=5, sticky='ew'
-        )
-        
-        # Port
-        ttk.Label(self.scrollable_frame, text=str(project.port)).grid(
-            row=row_num, column=2, padx=5, pady=5, sticky='ew'
-        )
-        
-        # Redis DB
-        ttk.Label(self.scrollable_frame, text=str(project.redis_db or '')).grid(
-            row=row_num, column=3, padx=5, pady=5, sticky='ew'
-        )
-        
-        # Actions
-        actions_frame = ttk.Frame(self.scrollable_frame)
-        actions_frame.grid(row=row_num, column=4, padx=5, pady=5, sticky='ew')
+        Args:
+            handler: Action to run
+
+        """
+        if self._menu_project is not None:
+            handler(self._menu_project)
+
+    def _show_actions(self, event: tk.Event) -> None:
+        """Show the actions menu for the project under the pointer."""
+        project_name = self.tree.identify_row(event.y)
+        if not project_name or not (project := self._get_project(project_name)):
+            return
         
-        # Frontend process button
-        fe_button_text = "Stop FE" if project.fe_process_pid else "Start FE"
-        fe_button = ttk.Button(
-            actions_frame,
-            text=fe_button_text,
-            width=8,
-            command=lambda p=project: self._toggle_frontend_process(p)
+        self.tree.selection_set(project_name)
+        self._menu_project = project
+        self.actions_menu.entryconfigure(
+            MENU_TOGGLE_FE, label="Stop FE" if project.fe_process_pid else "Start FE"
         )
-        fe_button.pack(side='left', padx=2)
-        
-        # URLs
-        if project.fe_url:
-            ttk.Button(
-                actions_frame, text="FE", width=4, style="Action.TButton",
-                command=lambda: webbrowser.open(project.fe_url)
-            ).pack(side='left', padx=2)
-        
-        if project.be_url:
-            ttk.Button(
-                actions_frame, text="BE", width=4, style="Action.TButton",
-                command=lambda: webbrowser.open(project.be_url)
-            ).pack(side='left', padx=2)
-        
-        ttk.Button(
-            actions_frame, text="IDE", width=4, style="Action.TButton",
-            command=lambda: self._open_in_cursor(project.name)
-        ).pack(side='left', padx=2)
-        
-        ttk.Button(
-            actions_frame, text="Edit", width=4, style="Action.TButton",
-            command=lambda: self._edit_project(project.name)
-        ).pack(side='left', padx=2)
-
-        ttk.Button(
-            actions_frame, text="🗑️", width=3, style="Delete.TButton",
-            command=lambda: self._delete_project(project.name)
-        ).pack(side='left', padx=2)
-        
+        for index, url in ((MENU_OPEN_FE, project.fe_url), (MENU_OPEN_BE, project.be_url)):
+            self.actions_menu.entryconfigure(index, state='normal' if url else 'disabled')
+        try:
+            self.actions_menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            self.actions_menu.grab_release()
+
     def _toggle_frontend_process(self, project: Project) -> None:
         """Toggle the frontend process for a project."""
         if project.fe_process_pid:
-            # Stop the process
-            try:
-                import psutil
-                if psutil.pid_exists(project.fe_process_pid):
-                    process = psutil.Process(project.fe_process_pid)
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except psutil.TimeoutExpired:
-                        process.kill()
-                
-                # Update project
-                self.project_service.update_project(project.name, {"fe_process_pid": None})
-                logger.info(f"Stopped frontend process for {project.name}")
-            except Exception as e:
-                logger.error(f"Error stopping frontend process: {e}")
+            # Stopping waits up to 5 seconds for the process to exit, which
+            # happens in a worker thread so the window stays responsive
+            if project.name in self._fe_stopping:
+                return
+            self._fe_stopping[project.name] = None
+            threading.Thread(
+                target=self._stop_fe_worker,
+                args=(project.name, project.fe_process_pid),
+                daemon=True
+            ).start()
+            self.frame.after(FE_STOP_POLL_MS, self._finish_stop_fe, project.name)
         else:
             # Start the process
             try:
                 # Find the frontend directory
-                project_dir = Path(project.directory)
-                fe_dir = None
-                
-                # Check possible frontend locations
-                fe_locations = [
-                    project_dir / "www",
-                    project_dir / "app",
-                    project_dir / f"{project.name}-app"
-                ]
-                
-                for location in fe_locations:
-                    if location.exists() and (location / "package.json").exists():
-                        fe_dir = location
-                        break
-                
+                fe_dir = self._resolve_fe_dir(project)
                 if not fe_dir:
                     logger.error(f"Could not find frontend directory for {project.name}")
                     return
                 
+                # Output is only read if it would be logged
+                log_stdout = logger.isEnabledFor(logging.INFO)
+                log_stderr = logger.isEnabledFor(logging.ERROR)
+
                 # Start the process
-                process = subprocess.Popen(
-                    ["npm", "run", "dev"],
-                    cwd=str(fe_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    start_new_session=True  # This ensures the process is in its own session
-                )
+                try:
+                    process = subprocess.Popen(
+                        ["npm", "run", "dev"],
+                        cwd=str(fe_dir),
+                        stdout=subprocess.PIPE if log_stdout else subprocess.DEVNULL,
+                        stderr=subprocess.PIPE if log_stderr else subprocess.DEVNULL,
+                        start_new_session=True  # This ensures the process is in its own session
+                    )
+                except OSError:
+                    # The directory may have moved; look for it again next time
+                    self._fe_dir_cache.pop(project.name, None)
+                    raise
                 
                 # Update project
                 self.project_service.update_project(project.name, {"fe_process_pid": process.pid})
                 logger.info(f"Started frontend process for {project.name} with PID {process.pid}")
                 
-                # Start a thread to read output
-                import threading
+                # Read output
+                if log_stdout:
+                    self._output_poller.watch(
+                        process.stdout, partial(self._queue_fe_log, logging.INFO, project.name)
+                    )
+                if log_stderr:
+                    self._output_poller.watch(
+                        process.stderr, partial(self._queue_fe_log, logging.ERROR, project.name)
+                    )
                 
-                def log_output(pipe, level):
-                    for line in pipe:
-                        line = line.strip()
-                        if line:
-                            logger.log(level, f"{project.name} FE: {line}")
-                
-                threading.Thread(
-                    target=log_output,
-                    args=(process.stdout, logging.INFO),
-                    daemon=True
-                ).start()
-                
-                threading.Thread(
-                    target=log_output,
-                    args=(process.stderr, logging.ERROR),
-                    daemon=True
-                ).start()
+                if (log_stdout or log_stderr) and not self._fe_log_scheduled:
+                    self._fe_log_scheduled = True
+                    self.frame.after(FE_LOG_POLL_MS, self._drain_fe_log)
                 
             except Exception as e:
                 logger.error(f"Error starting frontend process: {e}")
         
-        # Refresh list to update button text
-        self.load_projects()
+        # Show the new running state
+        self._update_row(project.name)
+
+    def _stop_fe_worker(self, project_name: str, pid: int) -> None:
+        """Stop a frontend process; called in the worker thread.
+
+        Args:
+            project_name: Name of the project the frontend belongs to
+            pid: Process ID of the frontend
+
+        """
+        try:
+            if psutil.pid_exists(pid):
+                process = psutil.Process(pid)
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except psutil.TimeoutExpired:
+                    process.kill()
+        except Exception as e:
+            logger.error("Error stopping frontend process: %s", e)
+            self._fe_stopping[project_name] = False
+        else:
+            self._fe_stopping[project_name] = True
+
+    def _finish_stop_fe(self, project_name: str) -> None:
+        """Record a stopped frontend once the worker is done.
+
+        Args:
+            project_name: Name of the project the frontend belongs to
+
+        """
+        if self._fe_stopping[project_name] is None:
+            self.frame.after(FE_STOP_POLL_MS, self._finish_stop_fe, project_name)
+            return
+
+        if self._fe_stopping.pop(project_name):
+            self.project_service.update_project(project_name, {"fe_process_pid": None})
+            logger.info("Stopped frontend process for %s", project_name)
+            self._update_row(project_name)
+
+    def _resolve_fe_dir(self, project: Project) -> Optional[Path]:
+        """Find the frontend directory of a project, probing the filesystem only once.
+
+        Args:
+            project: Project to look up
 
-    def _delete_project(self, project_name: str) -> None:
+        Returns:
+            The first of www, app and <name>-app holding a package.json,
+            None if there is none
+
+        """
+        if (fe_dir := self._fe_dir_cache.get(project.name)) is not None:
+            return fe_dir
+
+        project_dir = Path(project.directory)
+        fe_locations = (
+            project_dir / "www",
+            project_dir / "app",
+            project_dir / f"{project.name}-app"
+        )
+        fe_dir = next(
+            (location for location in fe_locations if (location / "package.json").is_file()), None
+        )
+        if fe_dir is not None:
+            self._fe_dir_cache[project.name] = fe_dir
+        return fe_dir
+
+    def _queue_fe_log(self, level: int, project_name: str, line: str) -> None:
+        """Queue a line of frontend output for logging; called by the output poller.
+
+        Args:
+            level: Logging level
+            project_name: Name of the project the frontend belongs to
+            line: Output line
+
+        """
+        try:
+            self._fe_log.put_nowait((level, project_name, line))
+        except queue.Full:
+            pass
+
+    def _drain_fe_log(self) -> None:
+        """Log the queued frontend output, one record per project and level."""
+        batches: Dict[Tuple[int, str], list] = {}
+        while True:
+            try:
+                level, name, line = self._fe_log.get_nowait()
+            except queue.Empty:
+                break
+            batches.setdefault((level, name), []).append(line)
+
+        for (level, name), lines in batches.items():
+            logger.log(level, "%s FE: %s", name, "\n".join(lines))
+
+        # Keep polling while any frontend started from here is running
+        if any(project.fe_process_pid for project in self.project_service.projects) or batches:
+            self.frame.after(FE_LOG_POLL_MS, self._drain_fe_log)
+        else:
+            self._fe_log_scheduled = False
+
+    def _delete_project(self, project: Project) -> None:
         """Delete a project after confirmation."""
+        project_name = project.name
         if not messagebox.askyesno(
             "Confirm Delete",
-            f"Are you sure you want to delete the project '{project_name}'?\n\n"
-            "This will:\n"
-            "- Delete the project directory\n"
-            "- Delete GitHub repositories\n"
-            "- Drop the database\n"
-            "- Remove Herd proxies\n\n"
-            "This action cannot be undone!"
+            DELETE_CONFIRM_TEMPLATE.format(name=project_name)
         ):
             return
 
-        # Create a dialog to show deletion progress
-        dialog = tk.Toplevel(self.frame)
-        dialog.title("Deleting Project")
-        dialog.transient(self.frame)
-        dialog.grab_set()
-        
-        # Center the dialog
-        dialog.geometry("500x300")
+        # Show the deletion progress in the dialog, centered over the list
+        dialog = self._get_delete_dialog()
+        dialog.title(f"Deleting {project_name}")
         dialog_x = self.frame.winfo_rootx() + (self.frame.winfo_width() // 2) - (500 // 2)
         dialog_y = self.frame.winfo_rooty() + (self.frame.winfo_height() // 2) - (300 // 2)
-        dialog.geometry(f"+{dialog_x}+{dialog_y}")
+        dialog.geometry(f"500x300+{dialog_x}+{dialog_y}")
+        self._delete_output.text.delete('1.0', tk.END)
+        self._delete_close_btn.pack_forget()
+        dialog.deiconify()
+        dialog.grab_set()
+
+        # Start deletion process; it runs in a worker thread so the dialog
+        # keeps drawing its output, and cannot be closed until it ended
+        self._delete_output.run(
+            partial(self.script_service.delete_project, project_name),
+            self._show_delete_close_button
+        )
+
+    def _get_delete_dialog(self) -> tk.Toplevel:
+        """Get the deletion progress dialog, building it on first use.
+
+        The dialog is hidden rather than destroyed when closed, so later
+        deletions reuse the window and its widgets.
+        """
+        if self._delete_dialog is not None:
+            return self._delete_dialog
+
+        dialog = tk.Toplevel(self.frame)
+        dialog.withdraw()
+        dialog.transient(self.frame)
+        dialog.protocol("WM_DELETE_WINDOW", self._close_delete_dialog)
         
         # Add output text widget
         output_text = tk.Text(dialog, height=15, width=60)
         output_text.pack(padx=10, pady=10, fill='both', expand=True)
+        self._delete_output = ScriptOutput(output_text)
         
-        def output_callback(line: str) -> None:
-            """Handle script output."""
-            output_text.insert(tk.END, f"{line}\n")
-            output_text.see(tk.END)
-            output_text.update()
-        
-        def close_dialog() -> None:
-            """Close the dialog and refresh projects."""
-            dialog.destroy()
-            # Reload projects from filesystem
-            self.project_service._load_projects()
-            self.load_projects()  # Refresh the projects list
-            # Show toast notification
-            self.toast.show("Project deleted successfully")
-        
-        # Start deletion process
-        success = self.script_service.delete_project(
-            project_name,
-            output_callback
-        )
+        # Close button, shown once the deletion ended
+        self._delete_close_btn = ttk.Button(dialog, command=self._close_delete_dialog)
         
+        self._delete_dialog = dialog
+        return dialog
+
+    def _show_delete_close_button(self, success: bool) -> None:
+        """Let the user close the dialog once the deletion ended.
+
+        Args:
+            success: Whether the project was deleted
+
+        """
         if success:
-            # Add close button
-            ttk.Button(
-                dialog,
-                text="Close",
-                command=close_dialog
-            ).pack(pady=10)
+            self._delete_close_btn.configure(text="Close", style="TButton")
         else:
-            # Add close button with error state
-            ttk.Button(
-                dialog,
-                text="Close (Error occurred)",
-                command=close_dialog,
-                style="Danger.TButton"
-            ).pack(pady=10)
+            # Close button with error state
+            self._delete_close_btn.configure(text="Close (Error occurred)", style="Danger.TButton")
+        self._delete_close_btn.pack(pady=10)
+
+    def _close_delete_dialog(self) -> None:
+        """Hide the dialog and refresh projects."""
+        if self._delete_output.running:
+            return
+        self._delete_dialog.grab_release()
+        self._delete_dialog.withdraw()
+        # Reload projects from filesystem
+        self.project_service._load_projects()
+        self.load_projects()  # Refresh the projects list
+        # Show toast notification
+        self.toast.show("Project deleted successfully")
 
     def load_projects(self) -> None:
-        """Load projects into the table."""
-        # Clear existing rows
-        for widget in self.scrollable_frame.grid_slaves():
-            if int(widget.grid_info()["row"]) > 0:  # Skip headers
-                widget.destroy()
+        """Bring the table in line with the projects, touching only rows that changed."""
+        self._projects = {project.name: project for project in self.project_service.projects}
+        rows = {project.name: self._row(project) for project in self._projects.values()}
         
-        # Add projects
-        for i, project in enumerate(self.project_service.projects, start=1):
-            self._create_row(i, project)
+        stale = self._rows.keys() - rows.keys()
+        if stale:
+            self.tree.delete(*stale)
+
+        # Inserting each new row at its index yields the right order as long
+        # as the rows already shown kept their relative order; checked here
+        # rather than by asking Tk for the children
+        kept = [name for name in self._rows if name in rows]
+        reordered = kept != [name for name in rows if name in self._rows]
+
+        for index, (name, (values, tags)) in enumerate(rows.items()):
+            if name not in self._rows:
+                self.tree.insert("", index, iid=name, values=values, tags=tags)
+            elif self._rows[name] != (values, tags):
+                self.tree.item(name, values=values, tags=tags)
+
+        # Projects only move when the order on disk changed
+        if reordered:
+            for index, name in enumerate(rows):
+                self.tree.move(name, "", index)
+
+        self._rows = rows
+
+    def _row(self, project: Project) -> Tuple[Tuple, Tuple[str, ...]]:
+        """Get the values and tags of a project's row."""
+        values = (
+            project.name,
+            project.pretty_name,
+            project.port,
+            project.redis_db if project.redis_db is not None else ''
+        )
+        return values, (RUNNING_TAG,) if project.fe_process_pid else ()
+
+    def _update_row(self, project_name: str) -> None:
+        """Redraw a single row after its project changed.
+
+        Args:
+            project_name: Name of the project
+
+        """
+        project = self.project_service.get_project(project_name)
+        if project is None or project_name not in self._rows:
+            self.load_projects()
+            return
+
+        self._projects[project_name] = project
+        row = self._row(project)
+        if self._rows[project_name] != row:
+            values, tags = row
+            self.tree.item(project_name, values=values, tags=tags)
+            self._rows[project_name] = row
 
     def _get_project(self, name: str) -> Optional[Project]:
-        """Get a project by name."""
-        return self.project_service.get_project(name)
+        """Get a project shown in the table by name."""
+        return self._projects.get(name)
 
-    def _open_fe_url(self, project_name: str) -> None:
+    def _open_fe_url(self, project: Project) -> None:
         """Open the frontend URL of the project."""
-        if project := self._get_project(project_name):
-            if project.fe_url:
-                logger.debug(f"Opening frontend URL: {project.fe_url}")
-                webbrowser.open(project.fe_url)
+        if project.fe_url:
+            logger.debug(f"Opening frontend URL: {project.fe_url}")
+            webbrowser.open(project.fe_url)
 
-    def _open_be_url(self, project_name: str) -> None:
+    def _open_be_url(self, project: Project) -> None:
         """Open the backend URL of the project."""
-        if project := self._get_project(project_name):
-            if project.be_url:
-                logger.debug(f"Opening backend URL: {project.be_url}")
-                webbrowser.open(project.be_url)
+        if project.be_url:
+            logger.debug(f"Opening backend URL: {project.be_url}")
+            webbrowser.open(project.be_url)
 
-    def _open_in_cursor(self, project_name: str) -> None:
+    def _open_in_cursor(self, project: Project) -> None:
         """Open the project in Cursor IDE."""
-        if project := self._get_project(project_name):
-            logger.debug(f"Opening project in Cursor: {project.directory}")
-            try:
-                subprocess.run(['cursor', str(project.directory)], check=True)
-            except subprocess.CalledProcessError:
-                messagebox.showerror("Error", "Failed to open Cursor IDE")
-            except FileNotFoundError:
-                messagebox.showerror("Error", "Cursor IDE not found. Is it installed?")
+        logger.debug(f"Opening project in Cursor: {project.directory}")
+        try:
+            # The cursor CLI hands the directory to the app and exits; there
+            # is nothing to wait for
+            subprocess.Popen(
+                [resolve_executable('cursor'), str(project.directory)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **POSIX_SPAWN_KWARGS
+            )
+        except OSError:
+            messagebox.showerror("Error", "Cursor IDE not found. Is it installed?")
 
-    def _edit_project(self, project_name: str) -> None:
+    def _edit_project(self, project: Project) -> None:
         """Open the edit dialog for the project."""
-        if project := self._get_project(project_name):
-            from .edit_dialog import EditDialog
-            EditDialog(self.frame, project, self.project_service, self.load_projects)
+        EditDialog(self.frame, project, self.project_service, self.load_projects)
 
     def _refresh_projects(self) -> None:
-        """Refresh projects from filesystem and update UI."""
+        """Refresh projects from filesystem in a worker thread."""
+        if self._rescan_thread is not None:
+            return
         logger.debug("Refreshing projects...")
         
         # Force a complete rescan from filesystem
-        self.project_service.rescan_projects()
+        self._fe_dir_cache.clear()
+        self.refresh_btn.state(['disabled'])
+        self._rescan_thread = threading.Thread(target=self._rescan_worker, daemon=True)
+        self._rescan_thread.start()
+        self.frame.after(RESCAN_POLL_MS, self._finish_refresh)
+
+    def _rescan_worker(self) -> None:
+        """Rescan the projects; called in the worker thread."""
+        try:
+            self.project_service.rescan_projects()
+        except Exception:
+            logger.exception("Rescanning projects failed")
+
+    def _finish_refresh(self) -> None:
+        """Show the rescanned projects once the worker is done."""
+        if self._rescan_thread is not None and self._rescan_thread.is_alive():
+            self.frame.after(RESCAN_POLL_MS, self._finish_refresh)
+            return
+
+        self._rescan_thread = None
+        self.refresh_btn.state(['!disabled'])
         
         # Reload UI
         self.load_projects()
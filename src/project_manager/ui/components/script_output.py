@@ -0,0 +1,106 @@
+"""Live output of scripts run from the window."""
+import tkinter as tk
+import logging
+import queue
+import threading
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# How often the output of a running script is copied into the text widget
+OUTPUT_POLL_MS = 50
+# Oldest output lines are dropped once the text widget holds more than this
+MAX_OUTPUT_LINES = 5000
+# Lines dropped beyond the limit, so trimming happens once per this many lines
+OUTPUT_TRIM_LINES = 500
+
+# Queued after the last output line of a finished script
+_DONE = object()
+
+class ScriptOutput:
+    """Runs a script in a worker thread and shows its output in a text widget.
+
+    Tk is not thread-safe, so the worker only queues its output lines; the
+    Tk thread moves everything queued into the widget with one insert per
+    poll and reports the result once the script ended.
+    """
+
+    def __init__(self, text: tk.Text) -> None:
+        """Initialize the output.
+
+        Args:
+            text: Text widget showing the output
+
+        """
+        self.text = text
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._success = False
+        self._on_done: Optional[Callable[[bool], None]] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether a script is running."""
+        return self._worker is not None
+
+    def run(
+        self,
+        script: Callable[[Callable[[str], None]], bool],
+        on_done: Callable[[bool], None]
+    ) -> None:
+        """Start a script.
+
+        Args:
+            script: Script to run in the worker thread; receives the output
+                callback and returns whether it succeeded
+            on_done: Called on the Tk thread with the script's result
+
+        """
+        self._on_done = on_done
+        self._worker = threading.Thread(target=self._run, args=(script,), daemon=True)
+        self._worker.start()
+        self.text.after(OUTPUT_POLL_MS, self._drain)
+
+    def _run(self, script: Callable[[Callable[[str], None]], bool]) -> None:
+        """Run the script; called in the worker thread."""
+        try:
+            self._success = script(self._queue.put)
+        except Exception:
+            logger.exception("Script failed")
+            self._success = False
+        finally:
+            self._queue.put(_DONE)
+
+    def _drain(self) -> None:
+        """Append queued output in one insert and finish once the script ended."""
+        lines = []
+        done = False
+        while True:
+            try:
+                line = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if line is _DONE:
+                done = True
+                break
+            lines.append(line)
+
+        if lines:
+            # Only follow the output if the user has not scrolled up to read
+            following = self.text.yview()[1] >= 0.999
+            self.text.insert(tk.END, '\n'.join(lines) + '\n')
+            # The text always ends in a newline, so the last index is one
+            # line past the output
+            line_count = int(self.text.index('end-1c').split('.')[0]) - 1
+            if line_count > MAX_OUTPUT_LINES:
+                excess = line_count - MAX_OUTPUT_LINES + OUTPUT_TRIM_LINES
+                self.text.delete('1.0', f'{excess + 1}.0')
+            if following:
+                self.text.see(tk.END)  # Scroll to bottom
+            self.text.update_idletasks()
+
+        if done:
+            self._worker = None
+            self._on_done(self._success)
+        else:
+            self.text.after(OUTPUT_POLL_MS, self._drain)
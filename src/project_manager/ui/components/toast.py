@@ -1,7 +1,10 @@
 import tkinter as tk
 from typing import Optional
-import time
-import threading
+
+# Appearance of the toast message
+TOAST_BACKGROUND = '#333333'
+TOAST_FOREGROUND = 'white'
+TOAST_FONT = ('Arial', 10)
 
 
 class Toast:
@@ -15,6 +18,7 @@ class Toast:
         """
         self.parent = parent
         self.window: Optional[tk.Toplevel] = None
+        self._after_id: Optional[str] = None
         
     def show(self, message: str, duration: float = 2.0) -> None:
         """Show a toast notification with the given message.
@@ -24,8 +28,7 @@ class Toast:
             duration: How long to show the message in seconds
         """
         # If there's an existing toast, destroy it
-        if self.window is not None:
-            self.window.destroy()
+        self._dismiss()
             
         # Create new window
         self.window = tk.Toplevel(self.parent)
@@ -37,9 +40,9 @@ class Toast:
             text=message,
             padx=20,
             pady=10,
-            bg='#333333',
-            fg='white',
-            font=('Arial', 10)
+            bg=TOAST_BACKGROUND,
+            fg=TOAST_FOREGROUND,
+            font=TOAST_FONT
         )
         label.pack()
         
@@ -55,11 +58,14 @@ class Toast:
         
         self.window.geometry(f"+{toast_x}+{toast_y}")
         
-        # Start a thread to close the toast after duration
-        def close_toast() -> None:
-            time.sleep(duration)
-            if self.window is not None:
-                self.window.destroy()
-                self.window = None
-                
-        threading.Thread(target=close_toast, daemon=True).start() 
\ No newline at end of file
+        # Close the toast after duration, on the Tk thread
+        self._after_id = self.parent.after(int(duration * 1000), self._dismiss)
+
+    def _dismiss(self) -> None:
+        """Close the toast if one is shown."""
+        if self._after_id is not None:
+            self.parent.after_cancel(self._after_id)
+            self._after_id = None
+        if self.window is not None:
+            self.window.destroy()
+            self.window = None
\ No newline at end of file
@@ -1 +0,0 @@
-# Current contents of main_window.py goes here as backup 
\ No newline at end of file
@@ -1,6 +1,8 @@
 import tkinter as tk
 from tkinter import ttk
 import logging
+import os
+import threading
 
 from .components.projects_list import ProjectsList
 from .components.new_project import NewProjectForm
@@ -62,8 +64,36 @@ class MainWindow(tk.Tk):
         )
         self.notebook.add(self.new_project.frame, text='New Project')
         
+        # Pick up project changes made by the status bar. Tk is not
+        # thread-safe, so the waiting thread only wakes the event loop
+        # through a pipe and the Tk thread applies the state
+        if self.project_service.state_channel is not None:
+            self._state_read_fd, self._state_write_fd = os.pipe()
+            self.tk.createfilehandler(self._state_read_fd, tk.READABLE, self._apply_state)
+            threading.Thread(
+                target=self._wait_for_state, name="state-sync", daemon=True
+            ).start()
+
         logger.debug("Window initialized and configured")
 
+    def _wait_for_state(self) -> None:
+        """Wake the Tk thread for each snapshot the status bar publishes."""
+        while self.project_service.state_channel.wait():
+            os.write(self._state_write_fd, b"\0")
+
+    def _apply_state(self, fd: int, mask: int) -> None:
+        """Apply project state published by the status bar process.
+
+        Args:
+            fd: Read end of the wake-up pipe
+            mask: Tk file event mask
+
+        """
+        os.read(fd, 4096)
+        if self.project_service.sync_shared_state():
+            logger.debug("Received project state from status bar")
+            self.projects_list.load_projects()
+
     def run(self) -> None:
         """Start the application."""
         self.mainloop() 
\ No newline at end of file
@@ -1,21 +1,95 @@
+import base64
 import logging
+import time
 import webbrowser
 import subprocess
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import psutil
 import rumps
+from PyObjCTools.AppHelper import callAfter
 import sys
 import os
 
 from ..services.project_service import ProjectService
 from ..services.script_service import ScriptService
 from ..models.project import Project
+from ..utils import config
+from ..utils.dir_watcher import DirectoryWatcher
+from ..utils.output_poller import OutputPoller
+from ..utils.process import POSIX_SPAWN_KWARGS, resolve_executable
+
+if TYPE_CHECKING:
+    from .window_manager import WindowProcess
 
 logger = logging.getLogger(__name__)
 
 # Get the path to the assets directory
 ASSETS_DIR = Path(__file__).parent.parent / "assets"
 ICON_PATH = ASSETS_DIR / "icon.png"
+_ICON_PATH_STR = str(ICON_PATH)
+# Whether the icon exists; checked once per process instead of per instance
+_ICON_READY = ICON_PATH.is_file()
+
+# 32x32 RGBA PNG of a ring around a dot, written out when the icon is missing
+_DEFAULT_ICON_B64 = (
+    b"iVBORw0KGgoAAAANSUhEUgAAACAAAAAgCAYAAABzenr0AAAAb0lEQVR42u2W2w0AIAgD3X9pnMAE"
+    b"CthqaOKn5TS81hqNMNnhUIJegfGat0AghmUQWZPU/apvhHysAcAYr4f9PBciGR8CQIKXQkRrPdoj"
+    b"BuB9gPYkpJehVCOitWL6MJIYxxILicRKJrGUSqzloz+1AQg/t0nADvH3AAAAAElFTkSuQmCC"
+)
+
+# Refresh requests this close together are merged into one rescan
+REFRESH_DEBOUNCE_SECONDS = 0.3
+
+# Titles of the permanent items around the projects section
+PROJECTS_HEADER = "Projects:"
+NO_PROJECTS = "No projects found"
+
+class _ProjectCallbacks:
+    """Menu callbacks of one project, shared by all of its menu items."""
+
+    __slots__ = ("app", "project")
+
+    def __init__(self, app: "ProjectManagerStatusBar", project: Project) -> None:
+        """Bind the callbacks to the app and the project they act on."""
+        self.app = app
+        self.project = project
+
+    def toggle_fe(self, _: rumps.MenuItem) -> None:
+        """Start or stop the project's frontend process."""
+        # Menu items outlive the project instance they were created for,
+        # so the current pid is looked up when clicked
+        project = self.app.project_service.get_project(self.project.name)
+        if project:
+            self.app.toggle_frontend_process(project)
+
+    def open_fe(self, _: rumps.MenuItem) -> None:
+        """Open the frontend URL in the browser."""
+        if self.project.fe_url:
+            webbrowser.open(self.project.fe_url)
+
+    def open_be(self, _: rumps.MenuItem) -> None:
+        """Open the backend URL in the browser."""
+        if self.project.be_url:
+            webbrowser.open(self.project.be_url)
+
+    def open_cursor(self, _: rumps.MenuItem) -> None:
+        """Open the project directory in Cursor."""
+        # The cursor CLI hands the directory to the app and exits; waiting
+        # for it would only freeze the menu
+        try:
+            subprocess.Popen(
+                [resolve_executable('cursor'), str(self.project.directory)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                **POSIX_SPAWN_KWARGS
+            )
+        except OSError as e:
+            logger.error("Failed to open %s in Cursor: %s", self.project.name, e)
+
 
 class ProjectManagerStatusBar(rumps.App):
     """Status bar app for Project Manager."""
@@ -23,70 +97,113 @@ class ProjectManagerStatusBar(rumps.App):
     def __init__(
         self,
         project_service: ProjectService,
-        script_service: ScriptService
+        script_service: ScriptService,
+        window: Optional["WindowProcess"] = None
     ) -> None:
         """Initialize the status bar app.
         
         Args:
             project_service: Project service instance
             script_service: Script service instance
+            window: Window process handle used by the "Open Window" item
         """
-        # Make sure assets directory exists
-        ASSETS_DIR.mkdir(exist_ok=True)
-        
         # Create a simple icon if it doesn't exist
-        if not ICON_PATH.exists():
+        global _ICON_READY
+        if not _ICON_READY:
+            ASSETS_DIR.mkdir(exist_ok=True)
             self._create_default_icon()
+            _ICON_READY = ICON_PATH.is_file()
         
         # Initialize with icon
         super().__init__(
             "PM",
-            icon=str(ICON_PATH),
+            icon=_ICON_PATH_STR,
             quit_button="Quit",
         )
         
         self.project_service = project_service
         self.script_service = script_service
+        self.window = window
         
-        # Set up initial menu
+        # Reads the output of every frontend process on one thread
+        self._output_poller = OutputPoller()
+
+        # Rescans run here, one at a time, so the menu stays responsive
+        self._rescan_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="rescan")
+
+        # Debounce state for refresh_projects
+        self._last_refresh_ts = 0.0
+        self._refresh_pending = False
+
+        # Project menu items by project name, in menu order, with the FE
+        # toggle subitem and the state they were built from
+        self._project_items: Dict[str, rumps.MenuItem] = {}
+        self._fe_items: Dict[str, rumps.MenuItem] = {}
+        self._project_state: Dict[str, Tuple] = {}
+
+        # Set up initial menu; only the projects section changes later on
+        self._no_projects = rumps.MenuItem(NO_PROJECTS)
+        self._no_projects.set_callback(None)  # Make it non-clickable
         self.menu = [
-            rumps.MenuItem("Projects:"),  # Header for projects section
-            rumps.MenuItem("No projects found"),  # Default item
-            None,  # Separator
-            rumps.MenuItem("Refresh", callback=self.refresh_projects),
-            None,  # Separator
-            rumps.MenuItem("Quit", callback=rumps.quit_application)
+            rumps.MenuItem(PROJECTS_HEADER),  # Header for projects section
+            self._no_projects,  # Default item
+            *self._footer_items()
         ]
         
-        # Load initial projects after a delay
-        rumps.Timer(self.on_ready, 1).start()
+        # Load initial projects as soon as the run loop starts; unlike a
+        # timer this runs once and leaves nothing scheduled behind
+        callAfter(self.on_ready)
+
+        # The kernel reports writes to the projects directory, so new or
+        # removed projects show up without anything polling
+        self._project_dirs = self._projects_dir_entries()
+        self._projects_watcher = DirectoryWatcher(
+            config.projects_dir(), partial(callAfter, self._check_projects_dir)
+        )
+        self._projects_watcher.start()
+
+        # Pick up project changes saved by the window process; the thread
+        # sleeps until the window publishes and ends when the channel closes
+        if self.project_service.state_channel is not None:
+            threading.Thread(
+                target=self._wait_for_shared_state, name="state-sync", daemon=True
+            ).start()
     
     def _create_default_icon(self) -> None:
         """Create a simple default icon."""
         try:
-            # Create a simple 32x32 PNG with a gear icon
-            from PIL import Image, ImageDraw
-            
-            # Create a new image with a transparent background
-            img = Image.new('RGBA', (32, 32), (0, 0, 0, 0))
-            draw = ImageDraw.Draw(img)
-            
-            # Draw a simple gear icon
-            # Outer circle
-            draw.ellipse([4, 4, 28, 28], outline=(0, 0, 0, 255), width=2)
-            # Inner circle
-            draw.ellipse([12, 12, 20, 20], fill=(0, 0, 0, 255))
-            
-            # Save the icon
-            img.save(ICON_PATH)
-            logger.debug(f"Created default icon at {ICON_PATH}")
+            ICON_PATH.write_bytes(base64.b64decode(_DEFAULT_ICON_B64))
+            logger.debug("Created default icon at %s", ICON_PATH)
         except Exception as e:
-            logger.error(f"Failed to create default icon: {e}")
+            logger.error("Failed to create default icon: %s", e)
             # If we can't create the icon, we'll fall back to text
     
-    def on_ready(self, _: rumps.Timer) -> None:
+    def _footer_items(self) -> List[Optional[rumps.MenuItem]]:
+        """Create the menu items shown below the projects.
+
+        Returns:
+            Menu items, with None for separators
+
+        """
+        items: List[Optional[rumps.MenuItem]] = [None]  # Separator
+        if self.window is not None:
+            items.append(rumps.MenuItem("Open Window", callback=self.open_window))
+        items.extend([
+            rumps.MenuItem("Refresh", callback=self.refresh_projects),
+            None,  # Separator
+            rumps.MenuItem("Quit", callback=rumps.quit_application)
+        ])
+        return items
+
+    def open_window(self, _: Optional[rumps.MenuItem] = None) -> None:
+        """Open the main window if it is not already running."""
+        self.window.open()
+
+    def on_ready(self, _: Optional[rumps.Timer] = None) -> None:
         """Handle app ready event."""
-        self.refresh_projects()
+        # The project service was loaded right before the app started, so
+        # the menu is built from memory
+        self._rebuild_menu()
     
     def _create_project_menu_item(self, project: Project) -> rumps.MenuItem:
         """Create a menu item for a project.
@@ -98,77 +215,189 @@ class ProjectManagerStatusBar(rumps.App):
             The created menu item
         """
         project_menu = rumps.MenuItem(project.pretty_name)
+        callbacks = _ProjectCallbacks(self, project)
         
-        # Create frontend process menu item with proper callback binding
-        fe_process_text = "Stop FE" if project.fe_process_pid else "Start FE"
         fe_process_item = rumps.MenuItem(
-            fe_process_text,
-            callback=self._make_toggle_callback(project)
+            self._fe_toggle_title(project), callback=callbacks.toggle_fe
         )
+        self._fe_items[project.name] = fe_process_item
         
         project_menu.update([
             fe_process_item,
             None,  # Separator
-            rumps.MenuItem(
-                "Open Frontend",
-                callback=lambda x, url=project.fe_url: webbrowser.open(url) if url else None
-            ),
-            rumps.MenuItem(
-                "Open Backend",
-                callback=lambda x, url=project.be_url: webbrowser.open(url) if url else None
-            ),
-            rumps.MenuItem(
-                "Open in Cursor",
-                callback=lambda x, dir=project.directory: subprocess.run(['cursor', str(dir)], check=True)
-            )
+            rumps.MenuItem("Open Frontend", callback=callbacks.open_fe),
+            rumps.MenuItem("Open Backend", callback=callbacks.open_be),
+            rumps.MenuItem("Open in Cursor", callback=callbacks.open_cursor)
         ])
         return project_menu
         
-    def _make_toggle_callback(self, project: Project):
-        """Create a callback for toggling a project's frontend process.
+    @staticmethod
+    def _fe_toggle_title(project: Project) -> str:
+        """Get the title of a project's frontend toggle item."""
+        return "Stop FE" if project.fe_process_pid else "Start FE"
+
+    @staticmethod
+    def _menu_state(project: Project) -> Tuple:
+        """Get the project fields its menu item is built from.
         
-        Args:
-            project: The project to create a callback for
-            
-        Returns:
-            The callback function
+        The frontend PID comes last so a toggle can be told apart from
+        changes that need a new menu item.
         """
-        def callback(_):
-            self.toggle_frontend_process(project)
-        return callback
-        
+        return (
+            project.pretty_name, project.fe_url, project.be_url, project.directory,
+            project.fe_process_pid
+        )
+
     def refresh_projects(self, _: Optional[rumps.MenuItem] = None) -> None:
-        """Refresh the projects list in the menu."""
+        """Refresh the projects list in the menu.
+
+        The first call refreshes right away; further calls within
+        REFRESH_DEBOUNCE_SECONDS are merged into a single trailing refresh.
+        """
+        if self._refresh_pending:
+            return
+        if time.monotonic() - self._last_refresh_ts >= REFRESH_DEBOUNCE_SECONDS:
+            self._do_refresh()
+            return
+        self._refresh_pending = True
+        rumps.Timer(self._do_refresh, REFRESH_DEBOUNCE_SECONDS).start()
+
+    def _do_refresh(self, timer: Optional[rumps.Timer] = None) -> None:
+        """Rescan the projects in the background and rebuild the menu afterwards.
+
+        Args:
+            timer: One-shot timer of a debounced refresh, if any
+
+        """
+        if timer is not None:
+            timer.stop()
+        self._refresh_pending = False
+        self._last_refresh_ts = time.monotonic()
         logger.debug("Refreshing status bar projects menu")
         
         # Force project rescan
+        future = self._rescan_executor.submit(self._rescan)
+        future.add_done_callback(lambda f: callAfter(self._finish_refresh, f))
+
+    def _rescan(self) -> Optional[frozenset]:
+        """Rescan the projects; called on the rescan thread.
+
+        Returns:
+            The directory listing of the projects directory as seen by the
+            rescan
+
+        """
+        entries = self._projects_dir_entries()
         self.project_service.rescan_projects()
+        return entries
+
+    def _finish_refresh(self, future: Future) -> None:
+        """Show the result of a rescan in the menu.
         
-        # Build menu from scratch
-        new_menu = [
-            rumps.MenuItem("Projects:"),  # Header
-        ]
-        
-        # Add projects
-        if self.project_service.projects:
-            for project in self.project_service.projects:
-                new_menu.append(self._create_project_menu_item(project))
-        else:
-            no_projects = rumps.MenuItem("No projects found")
-            no_projects.set_callback(None)  # Make it non-clickable
-            new_menu.append(no_projects)
+        Args:
+            future: Future of the finished rescan
+
+        """
+        try:
+            self._project_dirs = future.result()
+        except Exception as e:
+            logger.error("Error rescanning projects: %s", e)
+        self._rebuild_menu()
+
+    @staticmethod
+    def _projects_dir_entries() -> Optional[frozenset]:
+        """List the directories in the projects directory.
         
-        # Add remaining menu items
-        new_menu.extend([
-            None,  # Separator
-            rumps.MenuItem("Refresh", callback=self.refresh_projects),
-            None,  # Separator
-            rumps.MenuItem("Quit", callback=rumps.quit_application)
-        ])
+        Returns:
+            The directory names, or None if the projects directory is missing
+
+        """
+        try:
+            with os.scandir(config.projects_dir()) as it:
+                return frozenset(entry.name for entry in it if entry.is_dir())
+        except OSError:
+            return None
+
+    def _check_projects_dir(self) -> None:
+        """Refresh the menu when project directories were added, removed or renamed."""
+        # Saving the projects file, which lives in the same directory, is
+        # reported as well; that needs no rescan
+        if self._projects_dir_entries() != self._project_dirs:
+            logger.debug("Projects directory changed")
+            self.refresh_projects()
+
+    def _wait_for_shared_state(self) -> None:
+        """Hand each snapshot the window process publishes to the main thread."""
+        while self.project_service.state_channel.wait():
+            callAfter(self._sync_shared_state)
+
+    def _sync_shared_state(self) -> None:
+        """Rebuild the menu when the window process saved project changes."""
+        if self.project_service.sync_shared_state():
+            logger.debug("Received project state from window")
+            self._rebuild_menu()
+
+    def _rebuild_menu(self) -> None:
+        """Update the projects section of the menu from the in-memory projects.
+
+        Menu items are cached per project and only the ones whose project
+        changed are touched; a started or stopped frontend just retitles
+        its toggle item.
+        """
+        projects = self.project_service.projects
+        names = [p.name for p in projects]
+        current = set(names)
+
+        # Drop the items of projects that are gone
+        for name in [n for n in self._project_items if n not in current]:
+            self._remove_project_item(name)
+
+        # Reordered items are taken out here and put back in the new order
+        # below; the cached items are reused rather than built again
+        kept = [n for n in names if n in self._project_items]
+        reordered = kept != list(self._project_items)
+        if reordered:
+            for name in self._project_items:
+                del self.menu[self._project_state[name][0]]
+
+        if projects and NO_PROJECTS in self.menu:
+            del self.menu[NO_PROJECTS]
+        elif not projects and NO_PROJECTS not in self.menu:
+            self.menu.insert_after(PROJECTS_HEADER, self._no_projects)
         
-        # Replace entire menu
-        self.menu.clear()
-        self.menu = new_menu
+        previous = PROJECTS_HEADER
+        for project in projects:
+            state = self._menu_state(project)
+            old_state = self._project_state.get(project.name)
+            if old_state is None or old_state[:-1] != state[:-1]:
+                if old_state is not None:
+                    self._remove_project_item(project.name)
+                item = self._create_project_menu_item(project)
+                self.menu.insert_after(previous, item)
+                self._project_items[project.name] = item
+            else:
+                if old_state != state:
+                    self._fe_items[project.name].title = self._fe_toggle_title(project)
+                if reordered:
+                    self.menu.insert_after(previous, self._project_items[project.name])
+            self._project_state[project.name] = state
+            previous = project.pretty_name
+
+        # Keep the cache in menu order for the next reorder check
+        self._project_items = {name: self._project_items[name] for name in names}
+
+    def _remove_project_item(self, name: str) -> None:
+        """Remove a project's item from the menu and the cache.
+
+        Args:
+            name: Name of the project
+
+        """
+        self._project_items.pop(name, None)
+        self._fe_items.pop(name, None)
+        state = self._project_state.pop(name, None)
+        if state and state[0] in self.menu:
+            del self.menu[state[0]]
     
     def toggle_frontend_process(self, project: Project) -> None:
         """Toggle the frontend process for a project.
@@ -177,83 +406,114 @@ class ProjectManagerStatusBar(rumps.App):
             project: The project to toggle
         """
         if project.fe_process_pid:
-            # Stop the process
-            try:
-                import psutil
-                if psutil.pid_exists(project.fe_process_pid):
-                    process = psutil.Process(project.fe_process_pid)
-                    process.terminate()
-                    try:
-                        process.wait(timeout=5)
-                    except psutil.TimeoutExpired:
-                        process.kill()
-                
-                # Update project
-                self.project_service.update_project(project.name, {"fe_process_pid": None})
-                logger.info(f"Stopped frontend process for {project.name}")
-            except Exception as e:
-                logger.error(f"Error stopping frontend process: {e}")
-        else:
-            # Start the process
-            try:
-                # Find the frontend directory
-                project_dir = Path(project.directory)
-                fe_dir = None
-                
-                # Check possible frontend locations
-                fe_locations = [
-                    project_dir / "www",
-                    project_dir / "app",
-                    project_dir / f"{project.name}-app"
-                ]
-                
-                for location in fe_locations:
-                    if location.exists() and (location / "package.json").exists():
-                        fe_dir = location
-                        break
-                
-                if not fe_dir:
-                    logger.error(f"Could not find frontend directory for {project.name}")
-                    return
-                
-                # Start the process
-                process = subprocess.Popen(
-                    ["npm", "run", "dev"],
-                    cwd=str(fe_dir),
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True,
-                    bufsize=1,
-                    start_new_session=True  # This ensures the process is in its own session
+            # Stopping waits up to 5 seconds for the process to exit, which
+            # must not freeze the menu
+            threading.Thread(
+                target=self._stop_frontend_process,
+                args=(project.name, project.fe_process_pid),
+                daemon=True
+            ).start()
+            return
+
+        # Start the process
+        try:
+            # Find the frontend directory
+            fe_dir = self._find_fe_dir(project)
+            if not fe_dir:
+                logger.error("Could not find frontend directory for %s", project.name)
+                return
+
+            # Output is only read if it would be logged
+            log_stdout = logger.isEnabledFor(logging.INFO)
+            log_stderr = logger.isEnabledFor(logging.ERROR)
+
+            process = subprocess.Popen(
+                ["npm", "run", "dev"],
+                cwd=str(fe_dir),
+                stdout=subprocess.PIPE if log_stdout else subprocess.DEVNULL,
+                stderr=subprocess.PIPE if log_stderr else subprocess.DEVNULL,
+                start_new_session=True  # This ensures the process is in its own session
+            )
+
+            # Update project
+            self.project_service.update_project(project.name, {"fe_process_pid": process.pid})
+            logger.info("Started frontend process for %s with PID %s", project.name, process.pid)
+
+            # Read output; the poller thread ends once every pipe closed
+            if log_stdout:
+                self._output_poller.watch(
+                    process.stdout, partial(self._log_fe_output, logging.INFO, project.name)
                 )
-                
-                # Update project
-                self.project_service.update_project(project.name, {"fe_process_pid": process.pid})
-                logger.info(f"Started frontend process for {project.name} with PID {process.pid}")
-                
-                # Start a thread to read output
-                import threading
-                
-                def log_output(pipe, level):
-                    for line in pipe:
-                        line = line.strip()
-                        if line:
-                            logger.log(level, f"{project.name} FE: {line}")
-                
-                threading.Thread(
-                    target=log_output,
-                    args=(process.stdout, logging.INFO),
-                    daemon=True
-                ).start()
-                
-                threading.Thread(
-                    target=log_output,
-                    args=(process.stderr, logging.ERROR),
-                    daemon=True
-                ).start()
-                
-            except Exception as e:
-                logger.error(f"Error starting frontend process: {e}")
-        
-        # Refresh menu to update button text
-        self.refresh_projects()
\ No newline at end of file
+            if log_stderr:
+                self._output_poller.watch(
+                    process.stderr, partial(self._log_fe_output, logging.ERROR, project.name)
+                )
+
+        except Exception as e:
+            logger.error("Error starting frontend process: %s", e)
+
+        # Update the toggle title; only the pid changed, so the in-memory
+        # projects are current and no rescan is needed
+        self._rebuild_menu()
+
+    @staticmethod
+    def _find_fe_dir(project: Project) -> Optional[Path]:
+        """Find the frontend directory of a project.
+
+        The project directory is listed once and the candidates are looked
+        up in the listing, so only the package.json of a match is stat'ed.
+
+        Args:
+            project: Project to look up
+
+        Returns:
+            The first of www, app and <name>-app holding a package.json,
+            None if there is none
+
+        """
+        with os.scandir(project.directory) as it:
+            subdirs = {entry.name: entry.path for entry in it if entry.is_dir()}
+        for name in ("www", "app", f"{project.name}-app"):
+            if name in subdirs and os.path.isfile(os.path.join(subdirs[name], "package.json")):
+                return Path(subdirs[name])
+        return None
+
+    @staticmethod
+    def _log_fe_output(level: int, name: str, line: str) -> None:
+        """Log a line of frontend output; called on the poller thread."""
+        logger.log(level, "%s FE: %s", name, line)
+
+    def _stop_frontend_process(self, name: str, pid: int) -> None:
+        """Stop a frontend process; called in a worker thread.
+
+        Args:
+            name: Name of the project
+            pid: PID of the frontend process
+
+        """
+        try:
+            if psutil.pid_exists(pid):
+                process = psutil.Process(pid)
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except psutil.TimeoutExpired:
+                    process.kill()
+            logger.info("Stopped frontend process for %s", name)
+        except Exception as e:
+            logger.error("Error stopping frontend process: %s", e)
+            return
+
+        # Menus and the project service belong to the main thread
+        callAfter(self._frontend_stopped, name)
+
+    def _frontend_stopped(self, name: str) -> None:
+        """Record a stopped frontend process and update the menu.
+
+        Args:
+            name: Name of the project
+
+        """
+        self.project_service.update_project(name, {"fe_process_pid": None})
+        # Only the pid changed, so the in-memory projects are current
+        self._rebuild_menu()
\ No newline at end of file
@@ -1,6 +1,9 @@
 """Window management module."""
 import logging
 import sys
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from typing import Optional
 
 from ..services.project_service import ProjectService
 from ..services.script_service import ScriptService
@@ -8,13 +11,84 @@ from .main_window import MainWindow
 
 logger = logging.getLogger(__name__)
 
-def start_window() -> None:
-    """Start the main window process."""
+def start_window(
+    project_service: Optional[ProjectService] = None,
+    script_service: Optional[ScriptService] = None
+) -> None:
+    """Start the main window process.
+
+    Args:
+        project_service: Already loaded project service from the parent
+            process; a new one is created (and the projects directory
+            scanned) only when omitted
+        script_service: Script service from the parent process
+
+    """
     try:
-        project_service = ProjectService()
-        script_service = ScriptService()
+        if project_service is None:
+            project_service = ProjectService()
+        if script_service is None:
+            script_service = ScriptService()
         window = MainWindow(project_service, script_service)
         window.run()
     except Exception as e:
-        logger.error(f"Error in window process: {e}", exc_info=True)
-        sys.exit(1) 
\ No newline at end of file
+        logger.error("Error in window process: %s", e, exc_info=True)
+        sys.exit(1)
+
+
+class WindowProcess:
+    """Runs the main window in a child process that can be reopened.
+
+    With a forkserver context every (re)open forks the already-preloaded
+    forkserver interpreter instead of starting a fresh one.
+    """
+
+    def __init__(
+        self,
+        ctx: BaseContext,
+        project_service: ProjectService,
+        script_service: ScriptService
+    ) -> None:
+        """Initialize the window process handle.
+
+        Args:
+            ctx: Multiprocessing context used to start the window
+            project_service: Project service handed to the window
+            script_service: Script service handed to the window
+
+        """
+        self._ctx = ctx
+        self._args = (project_service, script_service)
+        self._process: Optional[BaseProcess] = None
+
+    def is_open(self) -> bool:
+        """Check whether the window process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def open(self) -> None:
+        """Start the window process unless it is already running."""
+        if self.is_open():
+            logger.debug("Window process already running")
+            return
+        self._process = self._ctx.Process(target=start_window, args=self._args)
+        self._process.start()
+        logger.debug("Started window process with PID: %s", self._process.pid)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the window process, escalating to SIGKILL if it ignores SIGTERM.
+
+        join() waits on the process sentinel, so it returns as soon as the
+        child exits rather than sleeping out the timeout. The child may belong
+        to the forkserver rather than to us, which rules out os.waitpid().
+
+        Args:
+            timeout: Seconds to wait after each signal
+
+        """
+        if not self.is_open():
+            return
+        self._process.terminate()
+        self._process.join(timeout)
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join(timeout)
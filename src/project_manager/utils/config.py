@@ -1,14 +1,62 @@
+import os
+from functools import cache
 from pathlib import Path
-from typing import Final
+from typing import Callable, Dict, Final
 
-# Project paths
-HOME: Final[Path] = Path.home()
-PROJECTS_DIR: Final[Path] = HOME / "projects" / "personal"
-SCRIPTS_DIR: Final[Path] = HOME / "projects" / "scripts"
-PROJECT_DATA_FILE: Final[Path] = PROJECTS_DIR / ".projects.json"
+# Project paths are resolved on first use, so importing the config does
+# not look up the home directory
 
-# Script paths
-NEW_PROJECT_SCRIPT: Final[Path] = SCRIPTS_DIR / "start-new-project.sh"
+
+@cache
+def home() -> Path:
+    """Get the user's home directory."""
+    return Path.home()
+
+
+@cache
+def projects_dir() -> Path:
+    """Get the directory holding the projects."""
+    return home() / "projects" / "personal"
+
+
+@cache
+def scripts_dir() -> Path:
+    """Get the directory holding the helper scripts."""
+    return home() / "projects" / "scripts"
+
+
+@cache
+def project_data_file() -> Path:
+    """Get the file the project records are saved to."""
+    return projects_dir() / ".projects.json"
+
+
+@cache
+def new_project_script() -> Path:
+    """Get the script that creates a new project."""
+    return scripts_dir() / "start-new-project.sh"
+
+
+# Accessors behind the module level path names
+_LAZY_PATHS: Final[Dict[str, Callable[[], Path]]] = {
+    "HOME": home,
+    "PROJECTS_DIR": projects_dir,
+    "SCRIPTS_DIR": scripts_dir,
+    "PROJECT_DATA_FILE": project_data_file,
+    "NEW_PROJECT_SCRIPT": new_project_script,
+}
+
+
+def __getattr__(name: str) -> Path:
+    """Resolve the path names, e.g. PROJECTS_DIR, through their accessors."""
+    try:
+        return _LAZY_PATHS[name]()
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+
+# Dependency installs for new projects use only the local package caches
+OFFLINE_INSTALL: Final[bool] = os.environ.get("PM_OFFLINE") == "1"
 
 # Port configuration
 MIN_PORT: Final[int] = 3000
@@ -16,4 +64,4 @@ MAX_PORT: Final[int] = 3999
 
 # Redis configuration
 MIN_REDIS_DB: Final[int] = 0
-MAX_REDIS_DB: Final[int] = 999
\ No newline at end of file
+MAX_REDIS_DB: Final[int] = 999
@@ -0,0 +1,97 @@
+"""Change notifications for a directory without polling."""
+import logging
+import os
+import select
+import threading
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Opens the directory for event notifications only, so the watch does not
+# keep its volume from being unmounted (macOS); read-only elsewhere
+_O_EVTONLY = getattr(os, "O_EVTONLY", os.O_RDONLY)
+
+
+class DirectoryWatcher:
+    """Calls back when entries are added to, removed from or renamed in a directory.
+
+    A kqueue vnode filter on the directory makes the watching thread sleep
+    in the kernel until the directory is written; nothing is polled. Only
+    the directory itself is watched, not its subdirectories. The callback
+    runs on the watcher thread and must be thread-safe.
+    """
+
+    def __init__(self, path: Path, callback: Callable[[], None]) -> None:
+        """Initialize the watcher.
+
+        Args:
+            path: Directory to watch
+            callback: Called after each change to the directory's entries
+
+        """
+        self.path = path
+        self._callback = callback
+        self._thread: Optional[threading.Thread] = None
+        self._wake_fd: Optional[int] = None
+
+    def start(self) -> bool:
+        """Start watching.
+
+        Returns:
+            True if the directory is watched, False if kqueue is not
+            available or the directory cannot be opened
+
+        """
+        if not hasattr(select, "kqueue"):
+            logger.debug("kqueue not available, not watching %s", self.path)
+            return False
+        try:
+            dir_fd = os.open(self.path, _O_EVTONLY)
+        except OSError as e:
+            logger.warning("Cannot watch %s: %s", self.path, e)
+            return False
+
+        kq = select.kqueue()
+        read_fd, self._wake_fd = os.pipe()
+        kq.control([
+            select.kevent(
+                dir_fd,
+                filter=select.KQ_FILTER_VNODE,
+                flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                fflags=select.KQ_NOTE_WRITE,
+            ),
+            # Written to by stop() to end the thread
+            select.kevent(read_fd, filter=select.KQ_FILTER_READ, flags=select.KQ_EV_ADD),
+        ], 0)
+        self._thread = threading.Thread(
+            target=self._run, args=(kq, dir_fd, read_fd), name="dir-watcher", daemon=True
+        )
+        self._thread.start()
+        return True
+
+    def stop(self) -> None:
+        """Stop watching and wait for the watcher thread to end."""
+        if self._thread is None:
+            return
+        os.write(self._wake_fd, b"\0")
+        self._thread.join()
+        os.close(self._wake_fd)
+        self._thread = None
+        self._wake_fd = None
+
+    def _run(self, kq: "select.kqueue", dir_fd: int, read_fd: int) -> None:
+        """Wait for directory events until woken by stop()."""
+        try:
+            while True:
+                for event in kq.control(None, 2):
+                    if event.ident == read_fd:
+                        return
+                    try:
+                        self._callback()
+                    except Exception:
+                        logger.exception("Directory watcher callback failed")
+        finally:
+            kq.close()
+            os.close(dir_fd)
+            os.close(read_fd)
@@ -0,0 +1,158 @@
+"""Shared-memory state channel between the status bar and window processes."""
+import logging
+import struct
+from multiprocessing.context import BaseContext
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, Final, List, Union
+
+from .serialization import dumps, loads
+
+logger = logging.getLogger(__name__)
+
+# Sequence number (unsigned 64-bit) followed by payload length (unsigned 32-bit)
+_HEADER = struct.Struct("=QI")
+
+DEFAULT_CHANNEL_SIZE = 256 * 1024
+
+# Payload length published in place of a snapshot too large for the block
+_TOO_LARGE = 0xFFFFFFFF
+
+
+class _Reload:
+    """Type of RELOAD."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return "RELOAD"
+
+
+# Returned by poll when the other process saved a snapshot that did not fit
+# the channel; readers fall back to the projects file it was saved to
+RELOAD: Final = _Reload()
+
+
+class StateChannel:
+    """Latest-value channel for project snapshots shared between processes.
+
+    A single shared memory block holds a small header (sequence number and
+    payload length) followed by the JSON encoded snapshot. Publishing
+    overwrites the previous snapshot and bumps the sequence number; readers
+    only ever care about the newest state, so there is no queue to drain and
+    nothing goes through a pipe. Publishing also notifies a shared condition,
+    so a thread blocked in wait learns about new snapshots without polling.
+    The channel is handed to the child process as a ``Process`` argument,
+    which only pickles the block name, lock and condition.
+    """
+
+    def __init__(self, ctx: BaseContext, size: int = DEFAULT_CHANNEL_SIZE) -> None:
+        """Create a new channel.
+
+        Args:
+            ctx: Multiprocessing context used to create the lock
+            size: Size of the shared memory block in bytes
+
+        """
+        self._shm = SharedMemory(create=True, size=size)
+        self._shm.buf[:_HEADER.size] = _HEADER.pack(0, 0)
+        self._lock = ctx.Lock()
+        self._changed = ctx.Condition(self._lock)
+        self._owner = True
+        self._closed = False
+        self._last_seq = 0
+        self._waited_seq = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Return the picklable state for handing the channel to a child."""
+        return {"shm": self._shm, "lock": self._lock, "changed": self._changed}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Attach to the parent's shared memory block in a child process."""
+        self._shm = state["shm"]
+        self._lock = state["lock"]
+        self._changed = state["changed"]
+        self._owner = False
+        self._closed = False
+        self._last_seq = 0
+        self._waited_seq = 0
+
+    def publish(self, records: List[Dict[str, Any]]) -> None:
+        """Publish a new snapshot.
+
+        Args:
+            records: JSON serializable project records
+
+        """
+        payload = dumps(records)
+        end = _HEADER.size + len(payload)
+        too_large = end > self._shm.size
+        if too_large:
+            # Still bump the sequence number so readers know to reload
+            logger.warning("Snapshot of %s bytes does not fit the state channel", len(payload))
+
+        with self._lock:
+            seq = _HEADER.unpack_from(self._shm.buf)[0] + 1
+            if too_large:
+                _HEADER.pack_into(self._shm.buf, 0, seq, _TOO_LARGE)
+            else:
+                self._shm.buf[_HEADER.size:end] = payload
+                _HEADER.pack_into(self._shm.buf, 0, seq, len(payload))
+            # Our own snapshot is not news to us
+            self._last_seq = seq
+            self._changed.notify_all()
+
+    def poll(self) -> Union[List[Dict[str, Any]], _Reload, None]:
+        """Get the newest snapshot published by another process.
+
+        Returns:
+            The snapshot records if one was published since the last call,
+            RELOAD if it was too large for the channel, None otherwise
+
+        """
+        # Cheap unlocked peek; the sequence number only ever grows
+        if _HEADER.unpack_from(self._shm.buf)[0] == self._last_seq:
+            return None
+
+        with self._lock:
+            seq, size = _HEADER.unpack_from(self._shm.buf)
+            if size == _TOO_LARGE:
+                self._last_seq = seq
+                return RELOAD
+            payload = bytes(self._shm.buf[_HEADER.size:_HEADER.size + size])
+        self._last_seq = seq
+        return loads(payload) if size else None
+
+    def wait(self) -> bool:
+        """Block until another process publishes a snapshot.
+
+        Meant for a dedicated thread that hands the news to the UI thread,
+        which then calls poll. Each snapshot wakes the thread only once.
+
+        Returns:
+            True if there is a snapshot to poll, False once the channel
+            was closed in this process
+
+        """
+        with self._changed:
+            self._changed.wait_for(self._has_news)
+            if self._closed:
+                return False
+            self._waited_seq = _HEADER.unpack_from(self._shm.buf)[0]
+            return True
+
+    def _has_news(self) -> bool:
+        """Check whether wait should return; called with the lock held."""
+        if self._closed:
+            return True
+        seq = _HEADER.unpack_from(self._shm.buf)[0]
+        return seq != self._waited_seq and seq != self._last_seq
+
+    def close(self) -> None:
+        """Detach from the channel, destroying it in the owning process."""
+        with self._changed:
+            # Wakes every waiter, but only the ones in this process stop
+            self._closed = True
+            self._changed.notify_all()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
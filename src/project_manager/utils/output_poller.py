@@ -0,0 +1,96 @@
+"""Line-by-line reading of many child process pipes on one thread."""
+import logging
+import os
+import selectors
+import threading
+from typing import BinaryIO, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on how long a new pipe waits to be picked up by the poll loop
+POLL_INTERVAL = 0.2
+# Bytes read from a ready pipe at a time; dev servers are chatty
+READ_SIZE = 65536
+
+
+class _LineBuffer:
+    """Splits the bytes read from a pipe into lines for a callback."""
+
+    __slots__ = ("callback", "pending")
+
+    def __init__(self, callback: Callable[[str], None]) -> None:
+        self.callback = callback
+        self.pending = b""
+
+    def feed(self, data: bytes) -> None:
+        """Pass every completed line to the callback, keeping the partial one."""
+        *lines, self.pending = (self.pending + data).split(b"\n")
+        for line in lines:
+            self._emit(line)
+
+    def flush(self) -> None:
+        """Pass on the last line of a pipe that ended without a newline."""
+        if self.pending:
+            self._emit(self.pending)
+            self.pending = b""
+
+    def _emit(self, raw: bytes) -> None:
+        line = raw.decode("utf-8", "replace").strip()
+        if line:
+            self.callback(line)
+
+
+class OutputPoller:
+    """Reads the output of any number of child processes on a single thread.
+
+    Instead of a blocking reader thread per pipe, pipes are made
+    non-blocking and registered with one selector. The thread is started
+    when the first pipe is watched and ends once every pipe reached EOF.
+    Callbacks run on the poller thread and must be thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the poller."""
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def watch(self, pipe: BinaryIO, callback: Callable[[str], None]) -> None:
+        """Pass each non-empty line read from a pipe to a callback.
+
+        The pipe is closed once it reaches EOF.
+
+        Args:
+            pipe: Binary pipe of a child process, e.g. Popen.stdout
+            callback: Called with each stripped line
+
+        """
+        os.set_blocking(pipe.fileno(), False)
+        with self._lock:
+            self._selector.register(pipe, selectors.EVENT_READ, _LineBuffer(callback))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="output-poller", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        """Read ready pipes until none are left."""
+        while True:
+            with self._lock:
+                if not self._selector.get_map():
+                    self._thread = None
+                    return
+            for key, _ in self._selector.select(POLL_INTERVAL):
+                try:
+                    data = os.read(key.fd, READ_SIZE)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    logger.exception("Reading child output failed")
+                    data = b""
+                if data:
+                    key.data.feed(data)
+                    continue
+                key.data.flush()
+                with self._lock:
+                    self._selector.unregister(key.fileobj)
+                key.fileobj.close()
@@ -0,0 +1,24 @@
+"""Helpers for launching child processes cheaply."""
+import shutil
+from functools import lru_cache
+
+# subprocess launches children with posix_spawn() instead of fork()+exec()
+# only when the executable is an absolute path, no cwd, preexec_fn,
+# start_new_session or pass_fds is given and close_fds is False. Dropping
+# close_fds is safe here: descriptors Python creates are non-inheritable
+# (PEP 446), so children still only receive their stdio.
+POSIX_SPAWN_KWARGS = {"close_fds": False}
+
+
+@lru_cache(maxsize=None)
+def resolve_executable(name: str) -> str:
+    """Resolve a command name to its absolute path, caching the PATH lookup.
+
+    Args:
+        name: Command name, e.g. "cursor"
+
+    Returns:
+        The absolute path if found on PATH, the name unchanged otherwise
+
+    """
+    return shutil.which(name) or name
@@ -0,0 +1,44 @@
+"""JSON helpers that use orjson when it is installed."""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: JSON serializable object
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        The encoded JSON document
+
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: Encoded or decoded JSON document
+
+    Returns:
+        The parsed object
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
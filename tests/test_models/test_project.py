@@ -0,0 +1,63 @@
+"""Tests for the project model."""
+from dataclasses import FrozenInstanceError, replace
+from pathlib import Path
+
+import pytest
+
+from project_manager.models.project import Project
+
+
+def _make_project(**overrides: object) -> Project:
+    """Create a project with sensible defaults."""
+    fields = {
+        "name": "demo",
+        "pretty_name": "Demo",
+        "port": 3000,
+        "redis_db": 1,
+        "directory": Path("/tmp/demo"),
+    }
+    fields.update(overrides)
+    return Project(**fields)
+
+
+def test_default_urls_are_derived_from_name() -> None:
+    """Test that missing URLs default to the Herd .test domains."""
+    project = _make_project()
+
+    assert project.fe_url == "https://app.demo.test"
+    assert project.be_url == "https://api.demo.test"
+
+
+def test_explicit_urls_are_kept() -> None:
+    """Test that provided URLs are not overwritten."""
+    project = _make_project(fe_url="http://localhost:3000", be_url="http://localhost:8000")
+
+    assert project.fe_url == "http://localhost:3000"
+    assert project.be_url == "http://localhost:8000"
+
+
+def test_project_is_immutable_and_hashable() -> None:
+    """Test that projects cannot be mutated and can be used as set members."""
+    project = _make_project()
+
+    with pytest.raises(FrozenInstanceError):
+        project.port = 3001  # type: ignore[misc]
+    assert not hasattr(project, "__dict__")
+    assert project in {project}
+
+
+def test_replace_returns_updated_copy() -> None:
+    """Test that dataclasses.replace derives an updated project."""
+    project = _make_project()
+
+    updated = replace(project, fe_process_pid=1234)
+
+    assert updated.fe_process_pid == 1234
+    assert project.fe_process_pid is None
+
+
+def test_with_default_urls_matches_post_init_defaults() -> None:
+    """Test that the fast constructor produces the same project."""
+    project = Project.with_default_urls("demo", "Demo", 3000, 1, Path("/tmp/demo"))
+
+    assert project == _make_project()
@@ -0,0 +1,289 @@
+"""Tests for the project service."""
+import pickle
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+import pytest
+
+from project_manager.services import project_service as project_service_module
+from project_manager.services.project_service import ProjectService
+from project_manager.utils import config, serialization
+
+if TYPE_CHECKING:
+    from pytest_mock.plugin import MockerFixture
+
+
+@pytest.fixture
+def projects_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the service at an empty projects directory and data file."""
+    directory = tmp_path / "projects"
+    directory.mkdir()
+    monkeypatch.setattr(config, "projects_dir", lambda: directory)
+    monkeypatch.setattr(config, "project_data_file", lambda: tmp_path / "data" / "projects.json")
+    return directory
+
+
+@pytest.mark.parametrize(
+    ("script", "expected"),
+    [
+        ("next dev -p 3005", 3005),
+        ("next dev --turbo -p3006", 3006),
+        ("vite --port 3007", 3007),
+        ("vite --port=3008", 3008),
+        ("PORT=3009 node server.js", 3009),
+        ("PORT=4000 next dev -p 3010", 3010),
+        ("REPORT=1 next dev -p 3011", 3011),
+        ("REPORT=1 node server.js", None),
+        ("next dev", None),
+    ],
+)
+def test_extract_port_from_script(projects_dir: Path, script: str, expected: Optional[int]) -> None:
+    """Test that ports are found in the common script notations."""
+    service = ProjectService()
+
+    assert service._extract_port_from_script(script) == expected
+
+
+def test_load_detects_supported_layouts(projects_dir: Path) -> None:
+    """Test that only directories with a known app/api layout become projects."""
+    layouts = (("named", "named-app", "named-api"), ("plain", "app", "api"), ("www", "www", "api"))
+    for layout in layouts:
+        name, *subdirs = layout
+        for subdir in subdirs:
+            (projects_dir / name / subdir).mkdir(parents=True)
+    (projects_dir / "incomplete" / "app").mkdir(parents=True)
+    (projects_dir / "notes.txt").write_text("not a project")
+
+    service = ProjectService()
+
+    assert sorted(p.name for p in service.projects) == ["named", "plain", "www"]
+
+
+def test_redis_db_read_from_first_valid_env_entry(projects_dir: Path) -> None:
+    """Test that the first parseable REDIS_DB/REDIS_CACHE_DB value wins."""
+    api_dir = projects_dir / "demo" / "api"
+    api_dir.mkdir(parents=True)
+    (api_dir / ".env").write_text(
+        "APP_KEY=base64:abc=\nREDIS_DB=\nREDIS_DB=oops\nREDIS_CACHE_DB=4\nREDIS_DB=7\n"
+    )
+    service = ProjectService()
+
+    assert service._get_redis_db_from_env(projects_dir / "demo") == 4
+
+
+def test_named_layout_falls_back_to_other_candidates(projects_dir: Path) -> None:
+    """Test that files outside the detected layout's directories are still found."""
+    project_dir = projects_dir / "demo"
+    for subdir in ("demo-app", "demo-api", "api"):
+        (project_dir / subdir).mkdir(parents=True)
+    (project_dir / "api" / ".env").write_text("REDIS_DB=5\n")
+    (project_dir / "package.json").write_text('{"scripts": {"dev": "next dev -p 3004"}}')
+    service = ProjectService()
+
+    assert service._get_redis_db_from_env(project_dir) == 5
+    assert service._get_port_from_package(service._read_package_json(project_dir)) == 3004
+
+
+def test_detected_layout_probed_first(projects_dir: Path) -> None:
+    """Test that the detected layout's files win over other candidates."""
+    project_dir = projects_dir / "demo"
+    for subdir in ("demo-app", "demo-api", "api"):
+        (project_dir / subdir).mkdir(parents=True)
+    (project_dir / "api" / ".env").write_text("REDIS_DB=5\n")
+    (project_dir / "demo-api" / ".env").write_text("REDIS_DB=6\n")
+    (project_dir / "package.json").write_text('{"scripts": {"dev": "next dev -p 3004"}}')
+    (project_dir / "demo-app" / "package.json").write_text('{"scripts": {"dev": "next dev -p 3005"}}')
+    service = ProjectService()
+
+    assert service._get_redis_db_from_env(project_dir) == 6
+    assert service._get_port_from_package(service._read_package_json(project_dir)) == 3005
+
+
+def test_package_json_reparsed_after_change(projects_dir: Path) -> None:
+    """Test that the package.json cache notices edits to the file."""
+    app_dir = projects_dir / "demo" / "app"
+    app_dir.mkdir(parents=True)
+    pkg_file = app_dir / "package.json"
+    pkg_file.write_text('{"scripts": {"dev": "next dev -p 3001"}}')
+    service = ProjectService()
+
+    first = service._read_package_json(projects_dir / "demo")
+    assert service._read_package_json(projects_dir / "demo") is first
+
+    pkg_file.write_text('{"scripts": {"dev": "next dev -p 30002"}}')
+    pkg_data = service._read_package_json(projects_dir / "demo")
+    assert service._get_port_from_package(pkg_data) == 30002
+
+
+def test_update_project_keeps_indices_in_sync(projects_dir: Path) -> None:
+    """Test that lookups and port conflicts follow updates."""
+    for name in ("one", "two"):
+        for subdir in ("app", "api"):
+            (projects_dir / name / subdir).mkdir(parents=True)
+    service = ProjectService()
+    service.update_project("one", {"port": 3500})
+    service.update_project("two", {"port": 3600})
+
+    with pytest.raises(ValueError):
+        service.update_project("one", {"port": 3600})
+
+    updated = service.update_project("one", {"port": 3700})
+    assert updated is not None and updated.port == 3700
+    assert service.get_project("one") is updated
+    # The old port is free again
+    assert service.update_project("two", {"port": 3500}) is not None
+
+
+def test_next_redis_db_fills_first_gap(projects_dir: Path) -> None:
+    """Test that the lowest unused Redis DB is handed out."""
+    for name, redis_db in (("one", 0), ("two", 2)):
+        api_dir = projects_dir / name / "api"
+        api_dir.mkdir(parents=True)
+        (projects_dir / name / "app").mkdir()
+        (api_dir / ".env").write_text(f"REDIS_DB={redis_db}\n")
+    service = ProjectService()
+
+    assert service._get_next_redis_db() == 1
+    service.update_project("two", {"redis_db": 1})
+    assert service._get_next_redis_db() == 2
+
+
+def test_load_merges_saved_records_with_directory(projects_dir: Path, tmp_path: Path) -> None:
+    """Test that saved projects keep their order and data, including ones outside the directory."""
+    for path in (projects_dir / "local", projects_dir / "fresh", tmp_path / "elsewhere" / "remote"):
+        for subdir in ("app", "api"):
+            (path / subdir).mkdir(parents=True)
+    saved = [
+        {"name": "remote", "pretty_name": "Remote!", "port": 3100, "redis_db": 5,
+         "directory": str(tmp_path / "elsewhere" / "remote")},
+        {"name": "local", "pretty_name": "Local!", "port": 3200, "redis_db": 6,
+         "directory": str(projects_dir / "local")},
+        {"name": "gone", "pretty_name": "Gone", "port": 3300, "redis_db": 7,
+         "directory": str(projects_dir / "gone")},
+    ]
+    ProjectService()  # creates the data file
+    config.project_data_file().write_bytes(serialization.dumps(saved))
+
+    service = ProjectService()
+
+    assert [p.name for p in service.projects] == ["remote", "local", "fresh"]
+    assert [p.pretty_name for p in service.projects[:2]] == ["Remote!", "Local!"]
+    assert [p.port for p in service.projects[:2]] == [3100, 3200]
+
+
+def test_new_projects_get_distinct_ports(projects_dir: Path) -> None:
+    """Test that projects without a port in package.json are not given the same one."""
+    for name in ("one", "two", "three"):
+        for subdir in ("app", "api"):
+            (projects_dir / name / subdir).mkdir(parents=True)
+
+    service = ProjectService()
+
+    assert len({p.port for p in service.projects}) == 3
+
+
+def test_rescan_keeps_existing_project_state(projects_dir: Path) -> None:
+    """Test that a rescan preserves edits and the running frontend PID."""
+    for subdir in ("app", "api"):
+        (projects_dir / "demo" / subdir).mkdir(parents=True)
+    service = ProjectService()
+    service.update_project(
+        "demo", {"pretty_name": "My Demo", "fe_url": "https://demo.local", "fe_process_pid": 42}
+    )
+    (projects_dir / "demo" / "api" / ".env").write_text("REDIS_DB=9\n")
+
+    service.rescan_projects()
+
+    project = service.get_project("demo")
+    assert project is not None
+    assert project.pretty_name == "My Demo"
+    assert (project.fe_url, project.fe_process_pid) == ("https://demo.local", 42)
+    assert project.redis_db == 9
+
+
+def test_unchanged_save_skips_write(projects_dir: Path, mocker: "MockerFixture") -> None:
+    """Test that saving the state already on disk does not rewrite the file."""
+    for subdir in ("app", "api"):
+        (projects_dir / "demo" / subdir).mkdir(parents=True)
+    ProjectService()
+    service = ProjectService()
+    rename = mocker.spy(project_service_module.os, "replace")
+
+    service.save_projects()
+    assert rename.call_count == 0
+
+    service.update_project("demo", {"pretty_name": "Renamed"})
+    assert rename.call_count == 1
+
+
+def test_pickled_service_gets_own_lock(projects_dir: Path) -> None:
+    """Test that a service handed to another process can be pickled and keeps working."""
+    for subdir in ("app", "api"):
+        (projects_dir / "demo" / subdir).mkdir(parents=True)
+    service = ProjectService()
+
+    clone = pickle.loads(pickle.dumps(service))
+
+    assert clone._lock is not service._lock
+    assert clone.update_project("demo", {"pretty_name": "Renamed"}) is not None
+
+
+def test_rescan_assigns_distinct_values_to_new_projects(projects_dir: Path) -> None:
+    """Test that projects found in one rescan do not share ports or Redis DBs."""
+    service = ProjectService()
+    for name in ("one", "two", "three"):
+        for subdir in ("app", "api"):
+            (projects_dir / name / subdir).mkdir(parents=True)
+
+    service.rescan_projects()
+
+    assert len(service.projects) == 3
+    assert len({p.port for p in service.projects}) == 3
+    assert len({p.redis_db for p in service.projects}) == 3
+
+
+def test_rescan_does_not_reuse_values_of_known_projects(
+    projects_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a new project scanned before known ones gets a free port and Redis DB."""
+    for name, redis_db in (("p1", 0), ("p2", 1)):
+        for subdir in ("app", "api"):
+            (projects_dir / name / subdir).mkdir(parents=True)
+        (projects_dir / name / "api" / ".env").write_text(f"REDIS_DB={redis_db}\n")
+    service = ProjectService()
+    known = {p.name: (p.port, p.redis_db) for p in service.projects}
+    for subdir in ("app", "api"):
+        (projects_dir / "n0" / subdir).mkdir(parents=True)
+    # Scan the new project first, whatever order the filesystem lists
+    scan = service._iter_project_dirs
+    monkeypatch.setattr(
+        service, "_iter_project_dirs", lambda: iter(sorted(scan(), key=lambda p: p.name))
+    )
+
+    service.rescan_projects()
+
+    for name, values in known.items():
+        project = service.get_project(name)
+        assert project is not None and (project.port, project.redis_db) == values
+    new = service.get_project("n0")
+    assert new is not None
+    assert new.port not in {port for port, _ in known.values()}
+    assert new.redis_db == 2
+
+
+def test_sync_reloads_file_when_snapshot_did_not_fit(
+    projects_dir: Path, mocker: "MockerFixture"
+) -> None:
+    """Test that an oversized snapshot is picked up from the projects file instead."""
+    for subdir in ("app", "api"):
+        (projects_dir / "demo" / subdir).mkdir(parents=True)
+    channel = mocker.Mock()
+    channel.poll.return_value = project_service_module.RELOAD
+    service = ProjectService(channel)
+    # The other process saves a change whose snapshot was too large to share
+    ProjectService().update_project("demo", {"pretty_name": "Saved Elsewhere"})
+
+    assert service.sync_shared_state()
+
+    project = service.get_project("demo")
+    assert project is not None and project.pretty_name == "Saved Elsewhere"
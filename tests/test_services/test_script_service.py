@@ -1,5 +1,12 @@
+import json
+import pickle
+import shutil
+import subprocess
+import threading
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, List, cast
+from typing import TYPE_CHECKING, Callable, List, Optional, cast
+import pymysql
 import pytest
 
 from project_manager.services.script_service import ScriptService
@@ -85,4 +92,220 @@ def test_execute_new_project_script_missing_script(mocker: "MockerFixture") -> N
 
     # Execute & Verify
     with pytest.raises(FileNotFoundError):
-        script_service.execute_new_project_script("testapp", "Test App", 3000, 0)
\ No newline at end of file
+        script_service.execute_new_project_script("testapp", "Test App", 3000, 0)
+
+
+def test_database_connection_is_reused(mocker: "MockerFixture") -> None:
+    """Test that consecutive database operations share one connection."""
+    mock_connect = mocker.patch("pymysql.connect")
+    script_service = ScriptService()
+
+    script_service._create_database("first")
+    script_service._drop_database("second")
+
+    mock_connect.assert_called_once()
+    mock_connect.return_value.ping.assert_not_called()
+    assert mock_connect.call_args.kwargs["autocommit"] is True
+    mock_connect.return_value.commit.assert_not_called()
+    cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+    assert cursor.execute.call_count == 2
+
+
+def test_database_connection_reopened_after_error(mocker: "MockerFixture") -> None:
+    """Test that a failed statement discards the connection."""
+    mock_connect = mocker.patch("pymysql.connect")
+    cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+    cursor.execute.side_effect = [pymysql.err.OperationalError(2006, "gone away"), None]
+    script_service = ScriptService()
+
+    with pytest.raises(pymysql.err.OperationalError):
+        script_service._create_database("first")
+    script_service._create_database("first")
+
+    assert mock_connect.call_count == 2
+
+
+def test_dropped_connection_reopened_and_retried(mocker: "MockerFixture") -> None:
+    """Test that a statement on a connection the server dropped is retried once on a new one."""
+    mock_connect = mocker.patch("pymysql.connect")
+    cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+    cursor.execute.side_effect = [None, pymysql.err.OperationalError(2006, "gone away"), None]
+    script_service = ScriptService()
+
+    script_service._create_database("first")
+    script_service._create_database("second")
+
+    assert mock_connect.call_count == 2
+    assert cursor.execute.call_args_list[-1] == cursor.execute.call_args_list[-2]
+
+
+def test_statement_error_not_retried(mocker: "MockerFixture") -> None:
+    """Test that errors other than connection errors are raised without a retry."""
+    mock_connect = mocker.patch("pymysql.connect")
+    cursor = mock_connect.return_value.cursor.return_value.__enter__.return_value
+    cursor.execute.side_effect = [None, pymysql.err.ProgrammingError(1064, "syntax")]
+    script_service = ScriptService()
+
+    script_service._create_database("first")
+    with pytest.raises(pymysql.err.ProgrammingError):
+        script_service._create_database("second")
+
+    mock_connect.assert_called_once()
+    assert script_service._db_connection is None
+
+
+def test_pickled_service_does_not_carry_connection(mocker: "MockerFixture") -> None:
+    """Test that a service handed to another process connects on its own."""
+    mocker.patch("pymysql.connect")
+    script_service = ScriptService()
+    script_service._create_database("demo")
+
+    clone = pickle.loads(pickle.dumps(script_service))
+
+    assert clone._db_connection is None
+
+
+def test_parallel_output_is_relayed_on_calling_thread() -> None:
+    """Test that output from parallel chains reaches the callback on the caller's thread."""
+    script_service = ScriptService()
+    caller = threading.get_ident()
+    received: List[str] = []
+
+    def callback(line: str) -> None:
+        assert threading.get_ident() == caller
+        received.append(line)
+
+    def chain(name: str, emit: Optional[Callable[[str], None]]) -> None:
+        for i in range(3):
+            assert emit is not None
+            emit(f"{name} {i}")
+
+    script_service._run_parallel([partial(chain, "app"), partial(chain, "api")], callback)
+
+    assert sorted(received) == sorted(f"{name} {i}" for name in ("app", "api") for i in range(3))
+
+
+def test_parallel_chain_error_is_raised() -> None:
+    """Test that a failing chain makes the whole run fail once all chains ended."""
+    script_service = ScriptService()
+    finished: List[str] = []
+
+    def failing(emit: Optional[Callable[[str], None]]) -> None:
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        script_service._run_parallel(
+            [failing, lambda emit: finished.append("ok")], lambda line: None
+        )
+    assert finished == ["ok"]
+
+
+def test_run_command_streams_lines() -> None:
+    """Test that command output is split into lines, including a final unterminated one."""
+    script_service = ScriptService()
+    received: List[str] = []
+
+    result = script_service._run_command("printf 'one\\n  two  \\n\\nthree'", received.append)
+
+    assert received == ["$ printf 'one\\n  two  \\n\\nthree'", "one", "two", "", "three"]
+    assert result.stdout == "one\ntwo\n\nthree"
+
+
+def test_setup_frontend_sets_port_in_scripts(tmp_path: Path, mocker: "MockerFixture") -> None:
+    """Test that the template's dev port is replaced in package.json scripts."""
+    script_service = ScriptService()
+    mocker.patch.object(script_service, "_run_command")
+    frontend_dir = tmp_path / "demo-app"
+    frontend_dir.mkdir()
+    (frontend_dir / "package.json").write_text(json.dumps({
+        "name": "saasdev",
+        "scripts": {"dev": "next dev -p 3000", "start": "next start -p 3000", "lint": "next lint"},
+    }))
+
+    script_service._setup_frontend("demo", "Demo", 3123, tmp_path)
+
+    pkg_data = json.loads((frontend_dir / "package.json").read_text())
+    assert pkg_data["name"] == "demo"
+    assert pkg_data["scripts"] == {
+        "dev": "next dev -p 3123",
+        "start": "next start -p 3123",
+        "lint": "next lint",
+    }
+
+
+def test_remove_tree_deletes_everything(tmp_path: Path) -> None:
+    """Test that the concurrent delete removes nested trees, files and symlinks."""
+    root = tmp_path / "demo"
+    for subdir in ("demo-app/node_modules/pkg/lib", "demo-api/vendor/pkg", "demo-api/app"):
+        (root / subdir).mkdir(parents=True)
+        (root / subdir / "file.txt").write_text("x")
+    (root / "notes.txt").write_text("x")
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (root / "demo-app" / "link").symlink_to(outside)
+
+    ScriptService()._remove_tree(root)
+
+    assert not root.exists()
+    assert outside.exists()
+
+
+def test_remove_tree_splits_pnpm_store(tmp_path: Path, mocker: "MockerFixture") -> None:
+    """Test that each package in a pnpm store is deleted as its own job."""
+    root = tmp_path / "demo"
+    store = root / "demo-app" / "node_modules" / ".pnpm"
+    for package in ("react@18.2.0", "next@14.0.0"):
+        (store / package / "node_modules" / package.split("@")[0]).mkdir(parents=True)
+        (root / "demo-app" / "node_modules" / package.split("@")[0]).symlink_to(
+            store / package / "node_modules" / package.split("@")[0]
+        )
+    (store / "lock.yaml").write_text("x")
+    rmtree = mocker.spy(shutil, "rmtree")
+
+    ScriptService()._remove_tree(root)
+
+    assert not root.exists()
+    deleted = {call.args[0] for call in rmtree.call_args_list}
+    assert {store / "react@18.2.0", store / "next@14.0.0"} <= deleted
+
+
+def test_setup_frontend_writes_env_local(tmp_path: Path, mocker: "MockerFixture") -> None:
+    """Test that the template URLs and name in .env.example are replaced."""
+    script_service = ScriptService()
+    mocker.patch.object(script_service, "_run_command")
+    frontend_dir = tmp_path / "demo-app"
+    frontend_dir.mkdir()
+    (frontend_dir / "package.json").write_text('{"name": "saasdev"}')
+    (frontend_dir / ".env.example").write_text(
+        "NEXT_PUBLIC_API_URL=https://api.saasdev.test\nNEXT_PUBLIC_APP_URL=https://saasdev.test\nNEXT_PUBLIC_APP_NAME=SaasDev\n"
+    )
+
+    script_service._setup_frontend("demo", "My Demo", 3123, tmp_path)
+
+    assert (frontend_dir / ".env.local").read_text() == (
+        "NEXT_PUBLIC_API_URL=https://api.demo.test\n"
+        "NEXT_PUBLIC_APP_URL=https://app.demo.test\n"
+        "NEXT_PUBLIC_APP_NAME=My Demo\n"
+    )
+
+
+def test_run_chain_stops_at_first_failure(tmp_path: Path) -> None:
+    """Test that chained commands share one shell and stop when one fails."""
+    script_service = ScriptService()
+
+    with pytest.raises(subprocess.CalledProcessError):
+        script_service._run_chain(["mkdir -p made", "false", "mkdir -p skipped"], cwd=tmp_path)
+
+    assert (tmp_path / "made").is_dir()
+    assert not (tmp_path / "skipped").exists()
+
+
+def test_run_command_reports_missing_executable() -> None:
+    """Test that an unknown command fails like it would in a shell."""
+    script_service = ScriptService()
+
+    result = script_service._run_command("no-such-command-for-tests --flag", check=False)
+
+    assert result.returncode == 127
+    assert result.stdout == "no-such-command-for-tests: command not found"
+
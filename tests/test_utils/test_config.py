@@ -0,0 +1,28 @@
+"""Tests for the lazily resolved config paths."""
+from pathlib import Path
+
+import pytest
+
+from project_manager.utils import config
+
+
+def test_path_names_resolve_through_accessors(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that the old module level path names still work and are resolved once."""
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    for accessor in (config.home, config.projects_dir, config.project_data_file):
+        accessor.cache_clear()
+    try:
+        assert config.PROJECTS_DIR == tmp_path / "projects" / "personal"
+        assert config.PROJECT_DATA_FILE == config.project_data_file()
+        assert config.PROJECTS_DIR is config.projects_dir()
+    finally:
+        for accessor in (config.home, config.projects_dir, config.project_data_file):
+            accessor.cache_clear()
+
+
+def test_unknown_name_raises_attribute_error() -> None:
+    """Test that unknown names are reported like on any other module."""
+    with pytest.raises(AttributeError):
+        config.NOT_A_SETTING
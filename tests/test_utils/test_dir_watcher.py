@@ -0,0 +1,29 @@
+"""Tests for the directory watcher."""
+import select
+import threading
+from pathlib import Path
+
+import pytest
+
+from project_manager.utils.dir_watcher import DirectoryWatcher
+
+
+@pytest.mark.skipif(not hasattr(select, "kqueue"), reason="kqueue not available")
+def test_new_entry_is_reported(tmp_path: Path) -> None:
+    """Test that creating a directory entry wakes the watcher."""
+    changed = threading.Event()
+    watcher = DirectoryWatcher(tmp_path, changed.set)
+    assert watcher.start()
+    try:
+        (tmp_path / "project").mkdir()
+        assert changed.wait(timeout=5)
+    finally:
+        watcher.stop()
+
+
+def test_start_fails_for_missing_directory(tmp_path: Path) -> None:
+    """Test that a missing directory or platform without kqueue is not watched."""
+    watcher = DirectoryWatcher(tmp_path / "missing", lambda: None)
+
+    assert not watcher.start()
+    watcher.stop()
@@ -0,0 +1,92 @@
+"""Tests for the state channel."""
+import multiprocessing
+import threading
+from typing import Any, Dict, List
+
+from project_manager.utils.ipc import RELOAD, StateChannel
+
+
+def _publish_from_child(channel: StateChannel, records: List[Dict[str, Any]]) -> None:
+    """Publish records from a child process."""
+    channel.publish(records)
+    channel.close()
+
+
+def test_poll_returns_snapshot_published_by_other_process() -> None:
+    """Test that a snapshot published in a child is visible in the parent."""
+    ctx = multiprocessing.get_context("spawn")
+    channel = StateChannel(ctx)
+    records = [{"name": "demo", "port": 3000, "redis_db": 1}]
+    try:
+        assert channel.poll() is None
+
+        process = ctx.Process(target=_publish_from_child, args=(channel, records))
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert channel.poll() == records
+        # The same snapshot is only delivered once
+        assert channel.poll() is None
+    finally:
+        channel.close()
+
+
+def test_own_snapshot_is_not_echoed() -> None:
+    """Test that a publisher does not receive its own snapshot."""
+    channel = StateChannel(multiprocessing.get_context("spawn"))
+    try:
+        channel.publish([{"name": "demo"}])
+        assert channel.poll() is None
+    finally:
+        channel.close()
+
+
+def test_oversized_snapshot_asks_readers_to_reload() -> None:
+    """Test that a snapshot larger than the channel is announced instead of dropped."""
+    ctx = multiprocessing.get_context("spawn")
+    channel = StateChannel(ctx, size=64)
+    try:
+        process = ctx.Process(target=_publish_from_child, args=(channel, [{"name": "x" * 100}]))
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert channel.poll() is RELOAD
+        assert channel.poll() is None
+    finally:
+        channel.close()
+
+
+def test_wait_wakes_on_snapshot_from_other_process() -> None:
+    """Test that wait returns once another process publishes, and again only after the next one."""
+    ctx = multiprocessing.get_context("spawn")
+    channel = StateChannel(ctx)
+    woken = threading.Event()
+    results: List[bool] = []
+
+    def waiter() -> None:
+        while channel.wait():
+            results.append(True)
+            woken.set()
+        results.append(False)
+
+    thread = threading.Thread(target=waiter, daemon=True)
+    thread.start()
+    try:
+        channel.publish([{"name": "own"}])
+        assert not woken.wait(0.2)
+
+        process = ctx.Process(target=_publish_from_child, args=(channel, [{"name": "demo"}]))
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert woken.wait(10)
+        assert channel.poll() == [{"name": "demo"}]
+    finally:
+        channel.close()
+    thread.join(timeout=10)
+
+    assert not thread.is_alive()
+    assert results == [True, False]
@@ -0,0 +1,33 @@
+"""Tests for the output poller."""
+import subprocess
+import threading
+from typing import List
+
+from project_manager.utils.output_poller import OutputPoller
+
+
+def test_lines_from_several_processes_are_delivered() -> None:
+    """Test that one poller splits the output of several pipes into lines."""
+    poller = OutputPoller()
+    received: List[str] = []
+    lock = threading.Lock()
+
+    def collect(prefix: str, line: str) -> None:
+        with lock:
+            received.append(f"{prefix}:{line}")
+
+    processes = [
+        subprocess.Popen(["printf", "one\\n  two  \\n\\nthree"], stdout=subprocess.PIPE),
+        subprocess.Popen(["printf", "four\\n"], stdout=subprocess.PIPE),
+    ]
+    for prefix, process in zip("ab", processes):
+        poller.watch(process.stdout, lambda line, prefix=prefix: collect(prefix, line))
+    for process in processes:
+        process.wait()
+
+    thread = poller._thread
+    if thread is not None:
+        thread.join(timeout=5)
+
+    assert sorted(received) == ["a:one", "a:three", "a:two", "b:four"]
+    assert all(process.stdout.closed for process in processes)
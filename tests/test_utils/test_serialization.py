@@ -0,0 +1,33 @@
+"""Tests for the JSON helpers."""
+import json
+
+import pytest
+
+from project_manager.utils import serialization
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_round_trip(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Test that both backends round-trip records and emit bytes."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    records = [{"name": "demo", "port": 3000, "redis_db": None}]
+
+    for indent in (False, True):
+        payload = serialization.dumps(records, indent=indent)
+        assert isinstance(payload, bytes)
+        assert serialization.loads(payload) == records
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_invalid_json_raises_json_error(monkeypatch: pytest.MonkeyPatch, use_orjson: bool) -> None:
+    """Test that callers can keep catching json.JSONDecodeError."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+
+    with pytest.raises(json.JSONDecodeError):
+        serialization.loads(b"{not json")